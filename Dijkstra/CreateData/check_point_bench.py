@@ -0,0 +1,108 @@
+'''
+    check_point_bench.py
+
+    Micro-benchmark for the nearest point collector used
+    by create_graph's sweep.
+
+    The sweep is run once for each degree, with every call
+    to create_graph.check_point() recorded.  Those calls are
+    then replayed, one vertex at a time, through the current
+    check_point() (a heap of squared integer distances) and
+    through the original one (a list kept sorted with
+    bisect.insort() and a new lambda per call, comparing
+    floating point distances), and the time per vertex is
+    printed for each.  Each time is the best of three runs.
+'''
+import bisect
+import sys
+import time
+
+import create_graph
+import point
+import point_utils
+
+
+REPEAT = 3
+
+
+def original_check_point(nearest_pts, pts, idx, check_idx, num_needed) -> bool:
+    ''' check_point() as it was originally written '''
+    dist = point.distance_between(pts[idx], pts[check_idx])
+    if len(nearest_pts) < num_needed:
+        bisect.insort(nearest_pts, (check_idx, dist), key = lambda pt_data : pt_data[1])
+        return True
+    if dist >= nearest_pts[-1][1]:
+        return False
+    nearest_pts.pop()
+    bisect.insort(nearest_pts, (check_idx, dist), key = lambda pt_data : pt_data[1])
+    return True
+
+
+def record_calls(pts, degree):
+    ''' Run the sweep, and return the points in the order
+    it uses, and the check_point() calls it makes for each
+    vertex, as a list of (idx, num_needed, [check_idx, ...]).
+    '''
+    calls = {}
+    sweep_pts = []
+    check_point = create_graph.check_point
+
+    def recording_check_point(nearest_pts, pts, idx, check_idx, num_needed):
+        if len(sweep_pts) == 0:
+            sweep_pts.extend(pts)
+        calls.setdefault(idx, (num_needed, []))[1].append(check_idx)
+        return check_point(nearest_pts, pts, idx, check_idx, num_needed)
+
+    create_graph.check_point = recording_check_point
+    try:
+        for _ in create_graph.edge_lines(pts, degree):
+            pass
+    finally:
+        create_graph.check_point = check_point
+    return sweep_pts, [(idx, num_needed, checks) for idx, (num_needed, checks) in calls.items()]
+
+
+def replay(func, pts, calls) -> float:
+    ''' Replay the recorded calls through func, returning
+    the smallest CPU time over REPEAT runs.
+    '''
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.process_time()
+        for idx, num_needed, checks in calls:
+            nearest_pts = []
+            for check_idx in checks:
+                func(nearest_pts, pts, idx, check_idx, num_needed)
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main(argv):
+    ''' main function '''
+    if len(argv) < 2:
+        print("usage: check_point_bench <pointfile> [<degree> ...]")
+        print("    Times the original and current check_point() on the calls")
+        print("    that create_graph makes for the points in <pointfile>,")
+        print("    for each <degree> (default 4, 8 and 32).")
+        sys.exit()
+
+    pts = point_utils.load_points(argv[1])
+    degrees = [int(arg) for arg in argv[2:]] or [4, 8, 32]
+
+    print(f"{len(pts)} points")
+    print(f"    {'degree':>6} {'vertices':>9} {'checks':>8} "
+          f"{'original':>10} {'current':>10} {'speedup':>8}")
+    for degree in degrees:
+        sweep_pts, calls = record_calls(pts, degree)
+        num_checks = sum(len(checks) for _, _, checks in calls)
+        original_time = replay(original_check_point, sweep_pts, calls)
+        current_time = replay(create_graph.check_point, sweep_pts, calls)
+        # Times per vertex, in microseconds.
+        original_us = 1e6 * original_time / len(calls)
+        current_us = 1e6 * current_time / len(calls)
+        print(f"    {degree:6} {len(calls):9} {num_checks / len(calls):8.1f} "
+              f"{original_us:8.2f}us {current_us:8.2f}us {original_us / current_us:8.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
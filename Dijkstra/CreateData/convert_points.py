@@ -0,0 +1,44 @@
+'''
+    convert_points.py
+
+    Program to convert a point file between the text format
+    written by generate_points.py and the binary format.
+
+    The binary format is a 16 byte header, containing the
+    8 byte magic number b"PTSBIN01" and the number of points
+    as a little-endian unsigned 64 bit integer, followed by
+    the points as little-endian int32 x/y pairs.  It is about
+    half the size of the text format, and can be memory-mapped
+    (see point_utils.map_binary_coords()) so that loading it
+    does not copy the data.
+'''
+import sys
+
+
+import point_utils
+
+
+def main(argv):
+    ''' main function '''
+    if len(argv) < 3:
+        print("usage: convert_points <infile> <outfile>")
+        print("    converts a text point file to binary, or")
+        print("    a binary point file to text; the format of")
+        print("    <infile> is detected from its contents")
+        sys.exit()
+
+    if point_utils.is_binary_file(argv[1]):
+        pts = point_utils.read_binary_points(argv[1])
+        out_file = open(argv[2], "w", encoding="utf_8")
+        point_utils.write_points(pts, out_file)
+    else:
+        in_file = open(argv[1], "r", encoding="utf_8")
+        pts = point_utils.read_points(in_file)
+        in_file.close()
+        out_file = open(argv[2], "wb")
+        point_utils.write_binary_points(pts, out_file)
+    out_file.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -17,29 +17,54 @@
     distance between the points.
 '''
 
-import bisect
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import heapq
+import math
+import os
 import sys
 
+from typing import Container
+from typing import Iterable
+from typing import Iterator
 from typing import Tuple
 from typing import TypeAlias
 
+from grid_index import GridIndex
+from kd_tree import KDTree
 import point_utils
 import point
 
-IndexEdge: TypeAlias = Tuple[int,int]
-''' type IndexEdge = Tuple[int,int] '''
-
-def create_edge(idx1: int, idx2: int) -> IndexEdge:
-    ''' Create a edge from two point indices.
-    
-    An edge is a tuple containing the indices of the two points,
-    with the smaller index first.
+LeftNeighbors: TypeAlias = dict[int, array]
+''' type LeftNeighbors = dict[int, array] '''
+
+def add_edge(left_nbrs: LeftNeighbors, idx: int, other_idx: int):
+    ''' Record an edge from the point being processed, idx,
+    to another point.
+
+    The only time we need to know whether an edge has been
+    found is when the point with the larger index is processed,
+    so that the point with the smaller index can be passed over.
+    So left_nbrs maps the index of each point that hasn't been
+    processed yet to an array('i') of the smaller indices it
+    has edges to, and the array is removed when the point is
+    processed.  An edge to a point with a smaller index, which
+    has already been processed, is never looked up again, so
+    it is not recorded.  This is much smaller than a set of
+    all of the edges found so far.
     '''
-    return min(idx1, idx2), max(idx1, idx2)
+    if other_idx < idx:
+        return
+    nbrs = left_nbrs.get(other_idx)
+    if nbrs is None:
+        left_nbrs[other_idx] = array("i", (idx,))
+    else:
+        nbrs.append(idx)
 
 
 def check_point(
-        nearest_pts: list[Tuple[int,float]],
+        nearest_pts: list[Tuple[int,int,int]],
         pts: list[point.Point],
         idx: int,
         check_idx: int,
@@ -47,10 +72,13 @@ def check_point(
     ''' Check to see if a given point can be added to the list of nearest points.
 
         Arguments:
-        nearest_pts -- a list of the nearest points found so far
-                       Entry entry is a tuple containing the index of a point
-                       and the distance from pts[idx] to that point.
-                       The list is sorted by the distance.
+        nearest_pts -- the nearest points found so far, as a heap.
+                       Each entry is a tuple (-d2, -order, index), where
+                       d2 is the squared distance from pts[idx] to the
+                       point and order is when it was checked (see
+                       below), so nearest_pts[0] is the farthest point,
+                       and of points at the same distance, the last one
+                       checked.
         pts         -- the list of all points we're working with.
         idx         -- the index of the point we're generating closer points for
         check_idx   -- the index of the point we're thinking of adding
@@ -58,36 +86,144 @@ def check_point(
 
         Returns True if the point is added, False otherwise
     '''
-    dist = point.distance_between(pts[idx], pts[check_idx])
+    pt = pts[idx]
+    check_pt = pts[check_idx]
+    dx = check_pt.x - pt.x
+    dy = check_pt.y - pt.y
+    d2 = dx*dx + dy*dy
+
+    # The points are checked alternating left and right, moving
+    # one further out each time, so this is the order they are
+    # checked in, and points at the same distance are kept in it.
+    order = 2 * (idx - check_idx) if check_idx < idx else 2 * (check_idx - idx) + 1
 
     # If we don't have enough points yet, we just add it.
     if len(nearest_pts) < num_needed:
-        bisect.insort(nearest_pts, (check_idx, dist), key = lambda pt_data : pt_data[1])
+        heapq.heappush(nearest_pts, (-d2, -order, check_idx))
         return True
 
-    # If this is greater or equal to the last point, then
+    # If this is greater or equal to the farthest point, then
     # it is not a nearest point.
-    if dist >= nearest_pts[-1][1]:
+    if d2 >= -nearest_pts[0][0]:
         return False
 
-    # Otherwise we remove the last element (the point with the
-    # longest distance) and insert it into the list where it belongs.
-    # We also need to remove the edge from the list of edges.
-    # Note that this edge has to be one that we added for this
-    # vertex; otherwise it would have been ignored before this
-    # was called.
-    nearest_pts.pop()
-    bisect.insort(nearest_pts, (check_idx, dist), key = lambda pt_data : pt_data[1])
+    # Otherwise we replace the farthest point with this one.
+    # Note that the edge to the farthest point has to be one
+    # that we found for this vertex; otherwise it would have
+    # been ignored before this was called.
+    heapq.heapreplace(nearest_pts, (-d2, -order, check_idx))
     return True
 
 
-def create_graph(pts: list[point.Point], degree: int, outfile):
-    ''' Create a graph from a list of points
-    
+def sweep_nearest(
+        pts: list[point.Point],
+        xs: list[int],
+        i: int,
+        num_needed: int,
+        max_d2: int,
+        linked: Container[int]) -> list[Tuple[int,int,int]]:
+    ''' Find the points nearest to pts[i] by sweeping out from it.
+
+        Arguments:
+        pts         -- the list of all points, sorted by x coordinate.
+        xs          -- the x coordinates of pts.
+        i           -- the index of the point to find the nearest points to.
+        num_needed  -- the number of nearest points to find.
+        max_d2      -- the square of an upper bound on the distance
+                       between any two points.
+        linked      -- the indices of the points to the left of pts[i]
+                       that already have an edge to it; they are
+                       passed over.
+
+        Returns the nearest points as a heap; see check_point().
+    '''
+
+    # For each point, we want to alternate moving
+    # one point to the left and one point to the right
+    # looking for a point closer than any other point
+    # so far.  We can stop moving in a given direction
+    # whenever the index hits the end, or the x distance
+    # between the point we're processing and the next
+    # point in that direction is greater than the
+    # farthest of the closest num_needed points.
+    prev_idx = next_idx = i
+
+    # nearest_pts will hold the num_needed nearest points
+    # found so far, as a heap with the farthest one first;
+    # see check_point().
+    nearest_pts: list[Tuple[int,int,int]] = []
+
+    # Until we have num_needed points in our nearest_pts
+    # list, max_d2 is the upper bound we were given, so
+    # we'll take any point independent of its distance
+    # from vertex i.
+
+    while True:
+
+        # Each time through this loop we'll try to add one
+        # point to the left and one to the right.
+
+        # Note that having enough points does NOT mean we're
+        # done!  We may find additional points that are closer
+        # than ones we've already found.
+        have_enough: bool = len(nearest_pts) == num_needed
+
+        # Once we have at least num_needed new points,
+        # we only care about points closer than the
+        # farthest one in the list.
+        if have_enough:
+            max_d2 = -nearest_pts[0][0]
+
+        # Figure out if we can go left or right.  Note that
+        # once the next point differs in x by more than
+        # the farthest distance, we don't have to check that
+        # direction.  Comparing the squares gives the same answer.
+        if prev_idx == 0:
+            done_left: bool = True
+        else:
+            dx: int = xs[i] - xs[prev_idx-1]
+            done_left = dx*dx > max_d2
+        if next_idx == len(pts) - 1:
+            done_right: bool = True
+        else:
+            dx = xs[next_idx+1] - xs[i]
+            done_right = dx*dx > max_d2
+
+        # If we enough points, and can't go either left or
+        # right, we can leave.
+        if have_enough and done_left and done_right:
+            break
+
+        # This should absolutely not happen unless the degree
+        # parameter is absurdly high.  By the time
+        # we're out of points to check, we should have
+        # enough points and the previous 'if' statment
+        # shoud have been true.
+        if done_left and done_right:
+            raise RuntimeError(f"could not find enough edges for vertex {i}")
+
+        # Since we sorted the pts by their x coordinate, the
+        # edge (prev_idx, i) may already be in the edge list, and
+        # has already been taken into account in num_vertex_edges.
+        if not done_left:
+            prev_idx -= 1
+            if prev_idx not in linked:
+                check_point(nearest_pts, pts, i, prev_idx, num_needed)
+
+        if not done_right:
+            next_idx += 1
+            check_point(nearest_pts, pts, i, next_idx, num_needed)
+
+    return nearest_pts
+
+
+def edge_lines(pts: list[point.Point], degree: int) -> Iterator[str]:
+    ''' Generate the edges of a graph from a list of points,
+    as lines in the format described at the top of this file.
+
     Arguments:
     pts     -- The list of points to create the graph from.
     degree  -- The target degree of each point.
-    outfile -- The file to write the edges to
 
     The actual degree of any point may be up to twice the
     target degree, since we generate degree edges when
@@ -101,35 +237,33 @@ def create_graph(pts: list[point.Point], degree: int, outfile):
     # random for a given x value.
     pts = sorted(pts, key = lambda pt : pt.x)
 
+    # Each point appears in many edges, so format each one once.
+    labels: list[str] = [str(pt) for pt in pts]
+    xs: list[int] = [pt.x for pt in pts]
+
     # We need to get an upper bound on the maximum
-    # length of an edge.
+    # length of an edge.  All of the distances here are
+    # squared, so they stay integers; the square root is
+    # only taken for the weights that are written out.
     x_min: int = min(pts, key = lambda pt : pt.x).x
     y_min: int = min(pts, key = lambda pt : pt.y).y
     x_max: int = max(pts, key = lambda pt : pt.x).x
     y_max: int = max(pts, key = lambda pt : pt.y).y
     max_max_dist = (x_max - x_min) + (y_max - y_min)
+    max_max_d2: int = max_max_dist * max_max_dist
 
-    # We keep track of the set of edges we've already
-    # added so we don't add an edge twice.  Each edge
-    # is identified by the indices of its start and end
-    # vertices, with the smaller index first.
-    edges: set[IndexEdge] = set()
+    # We keep track of the edges we've already added
+    # so we don't add an edge twice; see add_edge().
+    left_nbrs: LeftNeighbors = {}
 
     # For each vertex, we'll keep track of the number
     # of edges we found for it so far.
     num_vertex_edges: list[int] = [0] * len(pts)
 
-    # For each point, we want to alternate moving
-    # one point to the left and one point to the right
-    # looking for a point closer than any other point
-    # so far.  We can stop moving in a given direction
-    # whenever the index hits the end, or the x distance
-    # between the point we're processing and the next
-    # point in that direction is greater than the
-    # farthest of the closest `degree` points.
-    for i, pt in enumerate(pts):
-
-        prev_idx = next_idx = i
+    # For each point, sweep out to find its nearest points;
+    # see sweep_nearest().
+    for i in range(len(pts)):
+        linked: Container[int] = left_nbrs.pop(i, ())
 
         # It would be unusual, but it's possible that
         # we already have enough edges for this vertex,
@@ -138,65 +272,9 @@ def create_graph(pts: list[point.Point], degree: int, outfile):
         if num_needed <= 0:
             continue
 
-        # nearest_pts will hold tuples (idx,dist) where
-        # idx is the index of one of the degree'th nearest
-        # points and dist is the distance to that point
-        # from point i.  The list is ordered by distance.
-        nearest_pts: list[Tuple[int,float]] = []
-
-        # Until we have num_needed points in our nearest_pts
-        # list, we'll take any point independent of its
-        # distance from vertex i.
-        max_dist: float = max_max_dist
-
-        while True:
-
-            # Each time through this loop we'll try to add one
-            # point to the left and one to the right.
-
-            # Note that having enough points does NOT mean we're
-            # done!  We may find additional points that are closer
-            # than ones we've already found.
-            have_enough: bool = len(nearest_pts) == num_needed
-
-            # Once we have at least num_needed new points,
-            # we only care about points closer than the
-            # farthest one in the list.
-            if have_enough:
-                max_dist = nearest_pts[-1][1]
-
-            # Figure out if we can go left or right.  Note that
-            # once the next point differs in x by more than
-            # max_dist, we don't have to check that direction.
-            done_left:  bool = prev_idx == 0            or pts[i].x - pts[prev_idx-1].x > max_dist
-            done_right: bool = next_idx == len(pts) - 1 or pts[next_idx+1].x - pts[i].x > max_dist
-
-            # If we enough points, and can't go either left or
-            # right, we can leave.
-            if have_enough and done_left and done_right:
-                break
-
-            # This should absolutely not happen unless the degree
-            # parameter is absurdly high.  By the time
-            # we're out of points to check, we should have
-            # enough points and the previous 'if' statment
-            # shoud have been true.
-            if done_left and done_right:
-                raise RuntimeError(f"could not find enough edges for vertex {i}")
-
-            # Since we sorted the pts by their x coordinate, the
-            # edge (prev_idx, i) may already be in the edge list, and
-            # has already been taken into account in num_vertex_edges.
-            if not done_left:
-                prev_idx -= 1
-                if (prev_idx, i) not in edges:
-                    check_point(nearest_pts, pts, i, prev_idx, num_needed)
-
-            if not done_right:
-                next_idx += 1
-                check_point(nearest_pts, pts, i, next_idx, num_needed)
-
-        # We didn't drop out of the loop until we had num_needed
+        nearest_pts = sweep_nearest(pts, xs, i, num_needed, max_max_d2, linked)
+
+        # sweep_nearest() didn't return until it had num_needed
         # edges, which means this vertex now has degree edges.
         num_vertex_edges[i] = degree
 
@@ -204,40 +282,306 @@ def create_graph(pts: list[point.Point], degree: int, outfile):
         # for the other vertices.  Note that any edges to vertices
         # at lower indices will end up with >degree edges because
         # of this.
-        for near_pt in nearest_pts:
-            idx = near_pt[0]
-            dist = near_pt[1]
+        # They are written nearest first.
+        for neg_d2, _, idx in sorted(nearest_pts, reverse = True):
+            dist = math.sqrt(-neg_d2)
             num_vertex_edges[idx] += 1
-            edges.add(create_edge(i, idx))
-            outfile.write(f"{pt} {pts[idx]} {dist:.4f}\n")
+            add_edge(left_nbrs, i, idx)
+            yield f"{labels[i]} {labels[idx]} {dist:.4f}\n"
+
+
+def index_edge_lines(pts: list[point.Point], degree: int, engine: str) -> Iterator[str]:
+    ''' Generate exactly the same lines as edge_lines(), but
+    find the nearest points with a spatial index instead of
+    the sweep.
+
+    Arguments:
+    pts     -- The list of points to create the graph from.
+    degree  -- The target degree of each point.
+    engine  -- The kind of index to use: "grid" for a GridIndex,
+               or "kdtree" for a KDTree.
+
+    The index is built over the points sorted by x, as the
+    sweep sees them, and orders points at the same distance
+    the same way the sweep does.
+    '''
+    pts = sorted(pts, key = lambda pt : pt.x)
+    labels: list[str] = [str(pt) for pt in pts]
+    xs: list[int] = [pt.x for pt in pts]
+    ys: list[int] = [pt.y for pt in pts]
+    index = GridIndex(xs, ys) if engine == "grid" else KDTree(xs, ys)
+    yield from merge_edge_lines(labels, degree, index.nearest_all(degree))
+
+
+def merge_edge_lines(
+        labels: list[str],
+        degree: int,
+        candidates: Iterable[list[Tuple[int,int]]]) -> Iterator[str]:
+    ''' Generate the same lines as edge_lines(), given the
+    degree nearest points of every point.
+
+    Arguments:
+    labels      -- The points, sorted by x, formatted for output.
+    degree      -- The target degree of each point.
+    candidates  -- For each point in turn, its degree nearest
+                   points as (squared distance, index) tuples,
+                   nearest first, with points at the same distance
+                   in the order the sweep checks them.
+    '''
+    left_nbrs: LeftNeighbors = {}
+    num_vertex_edges: list[int] = [0] * len(labels)
+    for i, nearest_all in enumerate(candidates):
+        linked: Container[int] = left_nbrs.pop(i, ())
+        num_needed: int = degree - num_vertex_edges[i]
+        if num_needed <= 0:
+            continue
+
+        # The sweep passes over the points to the left that
+        # already have an edge to this one.  There are exactly
+        # num_vertex_edges[i] of those, so the num_needed nearest
+        # of the other points are all among the degree nearest.
+        nearest: list[Tuple[int,int]] = [
+            (d2, j) for d2, j in nearest_all
+            if j > i or j not in linked][:num_needed]
+        if len(nearest) < num_needed:
+            raise RuntimeError(f"could not find enough edges for vertex {i}")
+
+        num_vertex_edges[i] = degree
+        for d2, idx in nearest:
+            num_vertex_edges[idx] += 1
+            add_edge(left_nbrs, i, idx)
+            yield f"{labels[i]} {labels[idx]} {math.sqrt(d2):.4f}\n"
+
+
+# The number of strips parallel_edge_lines() splits the points
+# into for each worker.  Using more strips than workers lets the
+# first strips be merged while the later ones are still running.
+STRIPS_PER_WORKER: int = 4
+
+# The margin, in points per unit of degree, that
+# _strip_candidates() starts with on either side of a strip.
+STRIP_MARGIN: int = 4
+
+
+def _strip_candidates(shm_name: str, num_pts: int, lo: int, hi: int,
+                      degree: int, max_d2: int) -> array:
+    ''' Worker for parallel_edge_lines(): find the degree
+    nearest points of points lo to hi-1 of the shared
+    coordinate block.
+
+    Points are only made for a window of the block: the strip
+    itself, and a margin of STRIP_MARGIN * degree points on
+    either side.  After each sweep, the same test the sweep
+    uses to stop is applied to the first point outside the
+    window; if the sweep over all of the points would have
+    gone on to that point, the margin on that side is doubled
+    and the sweep is done again.  So the strips overlap by
+    just enough to get the same answer as a sweep over all
+    of the points.
+
+    The result is a flat array of (squared distance, index)
+    pairs, degree for each point, nearest first.
+    '''
+    shm = shared_memory.SharedMemory(name=shm_name)
+    coords: memoryview = shm.buf.cast("i")[:2*num_pts]
+    try:
+        left_margin: int = STRIP_MARGIN * degree
+        right_margin: int = left_margin
+        win_lo: int = -1
+        win_hi: int = -1
+        result: array = array("q")
+        i: int = lo
+        while i < hi:
+            if win_lo != max(lo - left_margin, 0) or win_hi != min(hi + right_margin, num_pts):
+                win_lo = max(lo - left_margin, 0)
+                win_hi = min(hi + right_margin, num_pts)
+                window: memoryview = coords[2*win_lo:2*win_hi]
+                it = iter(window)
+                pts: list[point.Point] = [point.Point(x, y) for x, y in zip(it, it)]
+                window.release()
+                xs: list[int] = [pt.x for pt in pts]
+
+            # No point is passed over here; merge_edge_lines() does that.
+            try:
+                nearest_pts = sweep_nearest(pts, xs, i - win_lo, degree, max_d2, ())
+            except RuntimeError:
+                if win_lo == 0 and win_hi == num_pts:
+                    raise
+                left_margin *= 2
+                right_margin *= 2
+                continue
+
+            far_d2: int = -nearest_pts[0][0]
+            x: int = coords[2*i]
+            if win_lo > 0 and (x - coords[2*(win_lo-1)]) ** 2 <= far_d2:
+                left_margin *= 2
+                continue
+            if win_hi < num_pts and (coords[2*win_hi] - x) ** 2 <= far_d2:
+                right_margin *= 2
+                continue
+
+            for neg_d2, _, idx in sorted(nearest_pts, reverse = True):
+                result.append(-neg_d2)
+                result.append(win_lo + idx)
+            i += 1
+    finally:
+        coords.release()
+        shm.close()
+    return result
+
+
+def parallel_edge_lines(pts: list[point.Point], degree: int, workers: int = 0) -> Iterator[str]:
+    ''' Generate exactly the same lines as edge_lines(), with
+    the sweep split across several processes.
+
+    Arguments:
+    pts     -- The list of points to create the graph from.
+    degree  -- The target degree of each point.
+    workers -- The number of processes to use; it defaults
+               to os.cpu_count().
+
+    The points, sorted by x, are split into STRIPS_PER_WORKER
+    strips of consecutive points per worker, and the degree
+    nearest points of every point in a strip are found in a
+    ProcessPoolExecutor.  The coordinates are copied once into
+    a shared memory block, so the workers do not receive
+    pickled Points.  The strips are then merged in order by
+    merge_edge_lines(), which applies the add_edge() and
+    num_vertex_edges rules of edge_lines(), so the result
+    does not depend on the number of workers.
+    '''
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or degree <= 0 or len(pts) < 2:
+        yield from edge_lines(pts, degree)
+        return
+
+    pts = sorted(pts, key = lambda pt : pt.x)
+    labels: list[str] = [str(pt) for pt in pts]
+    num_pts: int = len(pts)
+
+    # The same bound as in edge_lines().
+    x_min: int = min(pts, key = lambda pt : pt.x).x
+    y_min: int = min(pts, key = lambda pt : pt.y).y
+    x_max: int = max(pts, key = lambda pt : pt.x).x
+    y_max: int = max(pts, key = lambda pt : pt.y).y
+    max_max_dist = (x_max - x_min) + (y_max - y_min)
+    max_max_d2: int = max_max_dist * max_max_dist
+
+    coords: array = array("i", [0]) * (2 * num_pts)
+    coords[0::2] = array("i", [pt.x for pt in pts])
+    coords[1::2] = array("i", [pt.y for pt in pts])
+    shm = shared_memory.SharedMemory(create=True, size=coords.itemsize * len(coords))
+    try:
+        shm.buf[:len(coords) * coords.itemsize] = memoryview(coords).cast("B")
+        del coords
+        num_strips: int = min(workers * STRIPS_PER_WORKER, num_pts)
+        bounds: list[int] = [num_pts * i // num_strips for i in range(num_strips + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_strip_candidates, shm.name, num_pts,
+                                       bounds[i], bounds[i+1], degree, max_max_d2)
+                       for i in range(num_strips)]
+
+            def strip_candidates() -> Iterator[list[Tuple[int,int]]]:
+                for future in futures:
+                    it = iter(future.result())
+                    pairs = list(zip(it, it))
+                    for k in range(0, len(pairs), degree):
+                        yield pairs[k:k+degree]
+
+            yield from merge_edge_lines(labels, degree, strip_candidates())
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# The ways create_graph() can find the nearest points:
+# "sweep" is edge_lines(), the others use index_edge_lines().
+ENGINES: Tuple[str, ...] = ("sweep", "grid", "kdtree")
+
+
+def create_graph(pts: list[point.Point], degree: int, outfile, engine: str = "sweep",
+                 workers: int = 1):
+    ''' Create a graph from a list of points
+
+    Arguments:
+    pts     -- The list of points to create the graph from.
+    degree  -- The target degree of each point.
+    outfile -- The file to write the edges to
+    engine  -- How to find the nearest points; one of ENGINES.
+               All of them produce the same output.
+    workers -- The number of processes the sweep is split
+               across, by parallel_edge_lines(); 0 means
+               os.cpu_count().  Only the sweep can be split.
+
+    The edges are written in large blocks by
+    point_utils.write_lines().
+    '''
+    if engine not in ENGINES:
+        raise ValueError(f"create_graph: unknown engine '{engine}'")
+    if workers != 1 and engine != "sweep":
+        raise ValueError(f"create_graph: the {engine} engine cannot use more than one worker")
+    if engine == "sweep" and workers != 1:
+        lines = parallel_edge_lines(pts, degree, workers)
+    elif engine == "sweep":
+        lines = edge_lines(pts, degree)
+    else:
+        lines = index_edge_lines(pts, degree, engine)
+    point_utils.write_lines(lines, outfile)
 
 
 def main(argv):
     ''' main function '''
-    if len(argv) < 3:
-        print("usage: create_graph <pointfile> <degree> [<graphfile>]")
+    args = [arg for arg in argv[1:] if not arg.startswith("--")]
+    opts = [arg for arg in argv[1:] if arg.startswith("--")]
+
+    engine = "sweep"
+    workers = 1
+    for opt in opts:
+        if opt.startswith("--engine="):
+            engine = opt[len("--engine="):]
+        elif opt.startswith("--workers="):
+            workers = int(opt[len("--workers="):])
+        else:
+            print(f"create_graph: unknown option '{opt}'")
+            sys.exit(1)
+    if engine not in ENGINES:
+        print(f"create_graph: unknown engine '{engine}'")
+        sys.exit(1)
+    if workers != 1 and engine != "sweep":
+        print("create_graph: only the sweep engine can use more than one worker")
+        sys.exit(1)
+
+    if len(args) < 2:
+        print("usage: create_graph [--engine=sweep|grid|kdtree] [--workers=<n>]")
+        print("                    <pointfile> <degree> [<graphfile>]")
         print("    Creates graph from the points in <pointfile>")
         print("    by connected each point with its <degree> closest neighbors.")
+        print("    <pointfile> may be a text or binary point file.")
         print("    If <graphfile> is not specified, the graph is written")
         print("    to standard output.")
         print("    Note that some vertices may end up with more")
         print("    then <degree> incident edges.")
+        print("    --engine selects how the nearest points are found:")
+        print("    by sweeping along the x axis (the default), with")
+        print("    a grid of buckets, or with a KD-tree.  The output")
+        print("    is the same.")
+        print("    --workers splits the sweep across <n> processes, or")
+        print("    one per CPU if <n> is 0.  The output is the same.")
         sys.exit()
 
-    in_file = open(argv[1], "r", encoding="utf_8")
-    pts = point_utils.read_points(in_file)
-    in_file.close()
+    pts = point_utils.load_points(args[0])
 
-    degree = int(argv[2])
+    degree = int(args[1])
 
-    if len(argv) >= 4:
-        out_file = open(argv[3], "w", encoding="utf_8")
+    if len(args) >= 3:
+        out_file = open(args[2], "w", encoding="utf_8")
     else:
         out_file = sys.stdout
 
-    create_graph(pts, degree, out_file)
+    create_graph(pts, degree, out_file, engine, workers)
 
-    if len(argv) >= 4:
+    if len(args) >= 3:
         out_file.close()
 
 
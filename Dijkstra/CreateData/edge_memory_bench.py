@@ -0,0 +1,65 @@
+'''
+    edge_memory_bench.py
+
+    Measures the memory create_graph.py uses to generate
+    the edges of a graph.
+
+    Each engine is run on the same points with tracemalloc
+    tracing, and the lines are counted and dropped as they
+    are generated, so the peak is the memory the engine
+    itself holds on to: the sorted points, their labels,
+    the nearest point search, and the record of which edges
+    have been found so far.  tracemalloc makes the engines
+    much slower, so no times are printed.
+'''
+import sys
+import tracemalloc
+
+import create_graph
+import point_utils
+
+
+def main(argv):
+    ''' main function '''
+    args = [arg for arg in argv[1:] if not arg.startswith("--")]
+    opts = [arg for arg in argv[1:] if arg.startswith("--")]
+
+    engines = list(create_graph.ENGINES)
+    for opt in opts:
+        if opt.startswith("--engines="):
+            engines = opt[len("--engines="):].split(",")
+        else:
+            print(f"edge_memory_bench: unknown option '{opt}'")
+            sys.exit(1)
+    for engine in engines:
+        if engine not in create_graph.ENGINES:
+            print(f"edge_memory_bench: unknown engine '{engine}'")
+            sys.exit(1)
+
+    if len(args) < 2:
+        print("usage: edge_memory_bench [--engines=<name>,...] <pointfile> <degree>")
+        print("    Prints the peak memory each create_graph engine uses")
+        print("    for the points in <pointfile>, in total and per edge.")
+        print(f"    The engines are {', '.join(create_graph.ENGINES)}; by default")
+        print("    all of them are run.")
+        sys.exit()
+
+    pts = point_utils.load_points(args[0])
+    degree = int(args[1])
+
+    print(f"{len(pts)} points, degree {degree}")
+    print(f"    {'engine':8} {'edges':>9} {'peak':>10} {'per edge':>9}")
+    for engine in engines:
+        if engine == "sweep":
+            lines = create_graph.edge_lines(pts, degree)
+        else:
+            lines = create_graph.index_edge_lines(pts, degree, engine)
+        tracemalloc.start()
+        num_edges = sum(1 for _ in lines)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"    {engine:8} {num_edges:9} {peak / 2**20:8.1f}MB {peak / num_edges:7.1f}B")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
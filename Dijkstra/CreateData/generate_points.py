@@ -11,24 +11,57 @@ import point_utils
 
 def main(argv):
     ''' main function '''
-    if len(argv) < 3:
-        print("usage: generate_points <size> <numpoints> [<filename>]")
+    args = [arg for arg in argv[1:] if not arg.startswith("--")]
+    opts = [arg for arg in argv[1:] if arg.startswith("--")]
+
+    circle = False
+    seed = None
+    for opt in opts:
+        if opt == "--circle":
+            circle = True
+        elif opt.startswith("--seed="):
+            seed = int(opt[len("--seed="):])
+        else:
+            print(f"generate_points: unknown option '{opt}'")
+            sys.exit(1)
+
+    if len(args) < 2:
+        print("usage: generate_points [--circle] [--seed=<n>] <size> <numpoints> [<filename>]")
         print("    generates <numpoints> points in a grid of <size> by <size>")
+        print("    with --circle, the points are on a circle of diameter <size>")
+        print("    with --seed, the same <n> always gives the same points")
         print("    if specified, the points are written to <filename>,")
         print("    otherwise they are written to stdout")
+        print("    if <filename> ends in .bin, the points are written")
+        print("    in the binary format (see convert_points.py)")
         sys.exit()
 
-    size = int(argv[1])
-    num_points = int(argv[2])
-    if len(argv) >= 4:
-        out_file = open(argv[3], "w", encoding="utf_8")
+    size = int(args[0])
+    num_points = int(args[1])
+    try:
+        if circle:
+            pts = point_utils.generate_circle_points(size, num_points, seed)
+        else:
+            pts = point_utils.generate_points(size, num_points, seed)
+    except ValueError as err:
+        print(err)
+        sys.exit(1)
+
+    binary = len(args) >= 3 and args[2].endswith(".bin")
+    if len(args) >= 3:
+        if binary:
+            out_file = open(args[2], "wb")
+        else:
+            out_file = open(args[2], "w", encoding="utf_8")
     else:
         out_file = sys.stdout
 
-    pts = point_utils.generate_points(size, num_points)
-    point_utils.write_points(pts, out_file)
+    if binary:
+        point_utils.write_binary_points(pts, out_file)
+    else:
+        point_utils.write_points(pts, out_file)
 
-    if len(argv) >= 4:
+    if len(args) >= 3:
         out_file.close()
 
 
@@ -0,0 +1,82 @@
+'''
+    graph_bench.py
+
+    Compares the create_graph.py engines.
+
+    Each engine is run on the same points, with the output
+    written to os.devnull, and timed (wall clock and CPU).
+    The outputs are also hashed, to check that every
+    engine produces exactly the same graph.
+'''
+import hashlib
+import os
+import sys
+import time
+
+import create_graph
+import point_utils
+
+
+class HashingFile:
+    ''' A write-only file that keeps a hash of everything
+    written to it, and passes it on to another file.
+    '''
+
+    def __init__(self, out_file):
+        self.out_file = out_file
+        self.hash = hashlib.sha256()
+
+    def write(self, text: str):
+        self.hash.update(text.encode())
+        self.out_file.write(text)
+
+
+def main(argv):
+    ''' main function '''
+    args = [arg for arg in argv[1:] if not arg.startswith("--")]
+    opts = [arg for arg in argv[1:] if arg.startswith("--")]
+
+    engines = list(create_graph.ENGINES)
+    for opt in opts:
+        if opt.startswith("--engines="):
+            engines = opt[len("--engines="):].split(",")
+        else:
+            print(f"graph_bench: unknown option '{opt}'")
+            sys.exit(1)
+    for engine in engines:
+        if engine not in create_graph.ENGINES:
+            print(f"graph_bench: unknown engine '{engine}'")
+            sys.exit(1)
+
+    if len(args) < 2:
+        print("usage: graph_bench [--engines=<name>,...] <pointfile> <degree>")
+        print("    Times each create_graph engine on the points in <pointfile>,")
+        print("    and checks that they all produce the same graph.")
+        print(f"    The engines are {', '.join(create_graph.ENGINES)}; by default")
+        print("    all of them are run.")
+        sys.exit()
+
+    pts = point_utils.load_points(args[0])
+    degree = int(args[1])
+
+    print(f"{len(pts)} points, degree {degree}")
+    print(f"    {'engine':8} {'wall':>9} {'cpu':>9}  output hash")
+    hashes = set()
+    with open(os.devnull, "w", encoding="utf_8") as devnull:
+        for engine in engines:
+            out_file = HashingFile(devnull)
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            create_graph.create_graph(pts, degree, out_file, engine)
+            cpu_time = time.process_time() - cpu_start
+            wall_time = time.perf_counter() - wall_start
+            digest = out_file.hash.hexdigest()
+            hashes.add(digest)
+            print(f"    {engine:8} {wall_time:9.3f} {cpu_time:9.3f}  {digest[:16]}")
+    if len(hashes) > 1:
+        print("graph_bench: the engines produced different graphs")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,141 @@
+'''
+    grid_index.py
+
+    A uniform grid of buckets over a set of points, for
+    finding the nearest neighbors of each point.
+
+    The bounding box of the points is divided into square
+    cells, sized so that each one holds a few points on
+    average.  To find the k nearest neighbors of a point,
+    the cells around its own cell are searched in rings
+    of growing size, until the k'th nearest point found
+    so far is closer than anything outside the rings.
+    This does not depend on how the points are spread
+    along the x axis, unlike the sweep in create_graph.py.
+'''
+
+import math
+
+from typing import Iterator
+from typing import Tuple
+
+
+class GridIndex:
+    ''' The GridIndex class
+
+    The points are given as two lists of coordinates,
+    and are referred to by their index in those lists.
+    Neighbors at the same distance are ordered by how far
+    apart their indices are, and then with the lower index
+    first, which is the order create_graph's sweep finds
+    them in when the points are sorted by x.
+    '''
+
+    # The average number of points per cell.
+    POINTS_PER_CELL = 2
+
+    def __init__(self, xs: list[int], ys: list[int]):
+        self.xs: list[int] = xs
+        self.ys: list[int] = ys
+        num_pts = len(xs)
+
+        self.x_min: int = min(xs)
+        self.y_min: int = min(ys)
+        area = (max(xs) - self.x_min + 1) * (max(ys) - self.y_min + 1)
+        self.cell_size: int = max(1, math.isqrt(area * self.POINTS_PER_CELL // num_pts))
+        self.num_cols: int = (max(xs) - self.x_min) // self.cell_size + 1
+        self.num_rows: int = (max(ys) - self.y_min) // self.cell_size + 1
+
+        # The cells are numbered row by row.  The indices of the
+        # points are sorted by cell, and the points in cell c are
+        # order[starts[c]:starts[c+1]], in increasing order, so a
+        # run of cells in a row is also one slice of order.
+        cell_of: list[int] = [self.cell(x, y) for x, y in zip(xs, ys)]
+        self.order: list[int] = sorted(range(num_pts), key = cell_of.__getitem__)
+        counts: list[int] = [0] * (self.num_cols * self.num_rows + 1)
+        for c in cell_of:
+            counts[c + 1] += 1
+        for c in range(1, len(counts)):
+            counts[c] += counts[c - 1]
+        self.starts: list[int] = counts
+
+    def cell(self, x: int, y: int) -> int:
+        ''' Return the number of the cell containing (x, y) '''
+        return ((y - self.y_min) // self.cell_size) * self.num_cols + \
+            (x - self.x_min) // self.cell_size
+
+    def _ring(self, col: int, row: int, r: int) -> list[int]:
+        ''' Return the indices of the points in the cells
+        exactly r cells away from (col, row).
+        '''
+        if r == 0:
+            c = row * self.num_cols + col
+            return self.order[self.starts[c]:self.starts[c + 1]]
+
+        order = self.order
+        starts = self.starts
+        num_cols = self.num_cols
+        col_lo = max(col - r, 0)
+        col_hi = min(col + r, num_cols - 1)
+        found: list[int] = []
+        # The top and bottom rows of the ring, in full.
+        for ring_row in (row - r, row + r):
+            if 0 <= ring_row < self.num_rows:
+                base = ring_row * num_cols
+                found.extend(order[starts[base + col_lo]:starts[base + col_hi + 1]])
+        # The left and right columns, between those rows.
+        for ring_col in (col - r, col + r):
+            if 0 <= ring_col < num_cols:
+                for ring_row in range(max(row - r + 1, 0), min(row + r, self.num_rows)):
+                    c = ring_row * num_cols + ring_col
+                    found.extend(order[starts[c]:starts[c + 1]])
+        return found
+
+    def nearest(self, idx: int, k: int) -> list[Tuple[int,int]]:
+        ''' Find the k nearest neighbors of point idx.
+
+        Returns a list of (squared distance, index) tuples,
+        nearest first, with ties ordered as described above.
+        The list is shorter than k only if there are fewer
+        than k other points.
+        '''
+        xs = self.xs
+        ys = self.ys
+        x = xs[idx]
+        y = ys[idx]
+        col = (x - self.x_min) // self.cell_size
+        row = (y - self.y_min) // self.cell_size
+        max_r = max(col, self.num_cols - 1 - col, row, self.num_rows - 1 - row)
+
+        # Each candidate is packed into one int, so that sorting
+        # them orders them by distance, then by index distance,
+        # then left before right:
+        #   key = d2 * scale + 2 * |j - idx| + (1 if j > idx else 0)
+        scale = 2 * len(xs) + 2
+        keys: list[int] = []
+        for r in range(max_r + 1):
+            keys.extend([((xs[j] - x) ** 2 + (ys[j] - y) ** 2) * scale +
+                         (2 * (j - idx) + 1 if j > idx else 2 * (idx - j))
+                         for j in self._ring(col, row, r) if j != idx])
+            # Every point outside rings 0 to r is more than
+            # r * cell_size away, so once the k'th nearest point
+            # is no farther than that, the search is done.
+            if len(keys) >= k:
+                keys.sort()
+                limit = r * self.cell_size
+                if keys[k - 1] // scale <= limit * limit:
+                    break
+        keys.sort()
+
+        result: list[Tuple[int,int]] = []
+        for key in keys[:k]:
+            d2, tie = divmod(key, scale)
+            result.append((d2, idx + (tie >> 1) if tie & 1 else idx - (tie >> 1)))
+        return result
+
+    def nearest_all(self, k: int) -> Iterator[list[Tuple[int,int]]]:
+        ''' Find the k nearest neighbors of every point, in
+        order, as nearest() would.
+        '''
+        for idx in range(len(self.xs)):
+            yield self.nearest(idx, k)
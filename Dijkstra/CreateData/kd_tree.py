@@ -0,0 +1,131 @@
+'''
+    kd_tree.py
+
+    A KD-tree over a set of points, for finding the
+    nearest neighbors of each point.
+
+    The tree is stored in a single list of point indices,
+    with no object per node.  A node is a range lo:hi of
+    that list; its children are lo:mid and mid:hi, where
+    mid = (lo + hi) // 2, and the points are arranged so
+    that every point in lo:mid has a coordinate no greater
+    than the split value, and every point in mid:hi has one
+    no smaller.  The coordinate used, x or y, is the one
+    with the larger spread in that node.  It is kept in a
+    bytearray, and the split value in an array, both
+    indexed by mid.  Nodes of at most LEAF_SIZE points
+    are not split.
+'''
+
+from array import array
+import heapq
+
+from typing import Iterator
+from typing import Tuple
+
+
+class KDTree:
+    ''' The KDTree class
+
+    The points are given as two lists of coordinates,
+    and are referred to by their index in those lists.
+    Neighbors at the same distance are ordered the same
+    way as by grid_index.GridIndex: by how far apart
+    their indices are, and then with the lower index first.
+    '''
+
+    LEAF_SIZE = 8
+
+    def __init__(self, xs: list[int], ys: list[int]):
+        self.xs: list[int] = xs
+        self.ys: list[int] = ys
+        num_pts = len(xs)
+        self.order: list[int] = list(range(num_pts))
+        # 0 if the node split at mid splits on x, 1 for y.
+        self.split_dim: bytearray = bytearray(num_pts)
+        self.split_value: array = array("l", [0]) * num_pts
+
+        order = self.order
+        coords = (xs, ys)
+        nodes: list[Tuple[int,int]] = [(0, num_pts)]
+        while len(nodes) > 0:
+            lo, hi = nodes.pop()
+            if hi - lo <= self.LEAF_SIZE:
+                continue
+            node = order[lo:hi]
+            node_xs = [xs[i] for i in node]
+            node_ys = [ys[i] for i in node]
+            dim = 0 if max(node_xs) - min(node_xs) >= max(node_ys) - min(node_ys) else 1
+            # A full sort is more than the median split needs,
+            # but it is done in C, which makes it faster here.
+            order[lo:hi] = sorted(node, key = coords[dim].__getitem__)
+            mid = (lo + hi) // 2
+            self.split_dim[mid] = dim
+            self.split_value[mid] = coords[dim][order[mid]]
+            nodes.append((lo, mid))
+            nodes.append((mid, hi))
+
+    def nearest(self, idx: int, k: int) -> list[Tuple[int,int]]:
+        ''' Find the k nearest neighbors of point idx.
+
+        Returns a list of (squared distance, index) tuples,
+        nearest first.  The list is shorter than k only if
+        there are fewer than k other points.
+        '''
+        xs = self.xs
+        ys = self.ys
+        order = self.order
+        split_dim = self.split_dim
+        split_value = self.split_value
+        leaf_size = self.LEAF_SIZE
+        x = xs[idx]
+        y = ys[idx]
+        query = (x, y)
+
+        # The candidates are packed into one int each, as in
+        # GridIndex.nearest(), and kept in a max-heap (of the
+        # negated keys) holding the k best found so far.
+        scale = 2 * len(xs) + 2
+        heap: list[int] = []
+        # Nodes still to visit, with a lower bound on the
+        # squared distance to any point in them.
+        nodes: list[Tuple[int,int,int]] = [(0, len(xs), 0)]
+        while len(nodes) > 0:
+            lo, hi, bound = nodes.pop()
+            if len(heap) == k and bound > -heap[0] // scale:
+                continue
+            if hi - lo <= leaf_size:
+                for j in order[lo:hi]:
+                    if j == idx:
+                        continue
+                    key = ((xs[j] - x) ** 2 + (ys[j] - y) ** 2) * scale + \
+                        (2 * (j - idx) + 1 if j > idx else 2 * (idx - j))
+                    if len(heap) < k:
+                        heapq.heappush(heap, -key)
+                    elif key < -heap[0]:
+                        heapq.heapreplace(heap, -key)
+                continue
+            mid = (lo + hi) // 2
+            dim = split_dim[mid]
+            diff = query[dim] - split_value[mid]
+            far_bound = max(bound, diff * diff)
+            # Visit the side the query point is on first.
+            if diff < 0:
+                nodes.append((mid, hi, far_bound))
+                nodes.append((lo, mid, bound))
+            else:
+                nodes.append((lo, mid, far_bound))
+                nodes.append((mid, hi, bound))
+
+        result: list[Tuple[int,int]] = []
+        for key in sorted(-key for key in heap):
+            d2, tie = divmod(key, scale)
+            result.append((d2, idx + (tie >> 1) if tie & 1 else idx - (tie >> 1)))
+        return result
+
+    def nearest_all(self, k: int) -> Iterator[list[Tuple[int,int]]]:
+        ''' Find the k nearest neighbors of every point, in
+        order, as nearest() would.
+        '''
+        for idx in range(len(self.xs)):
+            yield self.nearest(idx, k)
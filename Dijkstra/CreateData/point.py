@@ -3,6 +3,7 @@
 '''
 
 import math
+import re
 
 class Point:
     ''' The Point class
@@ -70,3 +71,35 @@ def parse_point(s):
     if len(fields) != 2:
         raise ValueError(f"parse_point: {len(fields)} fields found, 2 expected")
     return Point(int(fields[0]), int(fields[1]))
+
+
+# A line that is not blank, not a comment, and not exactly
+# in the format produced by __str__.
+_IRREGULAR_LINE = re.compile(r"^(?!\(-?\d+,-?\d+\)\r?$|[ \t\r]*$|#)", re.M)
+_COMMENT_LINE = re.compile(r"^#.*$", re.M)
+_SEPARATORS = str.maketrans("(),", "   ")
+
+
+def parse_points(s: str) -> list[Point]:
+    ''' Convert the contents of a point file to a list of Points
+
+    Blank lines and lines starting with '#' are skipped.
+    If every other line is exactly in the format produced
+    by __str__, all of the coordinates are pulled out of
+    the string in a single pass.  Otherwise each line is
+    given to parse_point(), so a malformed line raises
+    the same error it always has.
+    '''
+    if _IRREGULAR_LINE.search(s) is None:
+        if "#" in s:
+            s = _COMMENT_LINE.sub("", s)
+        coords = iter(map(int, s.translate(_SEPARATORS).split()))
+        return [Point(x, y) for x, y in zip(coords, coords)]
+
+    pts = []
+    for line in s.splitlines():
+        line = line.strip()
+        if len(line) == 0: continue
+        if line[0] == "#": continue
+        pts.append(parse_point(line))
+    return pts
@@ -1,35 +1,153 @@
+from array import array
+from itertools import islice
+import math
+import mmap
 import random
+import struct
+import sys
 
 
 import point
 
 
-def generate_points(size, num_points) -> list[point.Point]:
-    ''' generate a random list of points'''
-    num_generated = 0
-    pts = set()
-    while num_generated < num_points:
-        x = random.randint(0, size)
-        y = random.randint(0, size)
-        pt = point.Point(x, y)
-        if pt not in pts:
-            pts.add(pt)
-            num_generated += 1
-    pts_list: list[point.Point] = list(pts)
-    random.shuffle(pts_list)
-    return pts_list
+def generate_points(size, num_points, seed=None) -> list[point.Point]:
+    ''' generate a random list of points
+
+    The points are distinct cells of the (size+1) by (size+1)
+    grid, chosen by sampling cell numbers without replacement
+    and splitting each one into x and y, so no point is ever
+    drawn twice and thrown away.  The same seed always gives
+    the same points.
+    '''
+    side = size + 1
+    if num_points > side * side:
+        raise ValueError(f"generate_points: a grid of size {size} "
+                         f"has only {side * side} points")
+    rng = random.Random(seed)
+    return [point.Point(*divmod(cell, side)) for cell in rng.sample(range(side * side), num_points)]
+
+
+def generate_circle_points(size, num_points, seed=None) -> list[point.Point]:
+    ''' generate a random list of points on a circle
+
+    The circle has diameter size and fills the size by size
+    grid.  The points are chosen from the grid points nearest
+    to the circle, so a large share of them are on the convex
+    hull, which is the worst case for output-sensitive hull
+    algorithms.  Raises ValueError if there are fewer than
+    num_points such grid points.  The same seed always
+    gives the same points.
+    '''
+    radius = size / 2
+    candidates = set()
+    for i in range(size + 1):
+        offset = math.sqrt(max(radius * radius - (i - radius) ** 2, 0))
+        for j in (round(radius - offset), round(radius + offset)):
+            candidates.add(point.Point(i, j))
+            candidates.add(point.Point(j, i))
+    if num_points > len(candidates):
+        raise ValueError(f"generate_circle_points: a circle of size {size} "
+                         f"has only {len(candidates)} points")
+    candidates_list = sorted(candidates, key=lambda pt: (pt.x, pt.y))
+    return random.Random(seed).sample(candidates_list, num_points)
+
+
+# write_lines() joins this many lines into each write.
+WRITE_CHUNK_LINES = 65536
+
+
+def write_lines(lines, out_file):
+    ''' write lines of text, each ending in a newline,
+    to the given file
+
+    lines may be any iterable, including a generator.
+    The lines are joined into blocks of WRITE_CHUNK_LINES
+    and each block is written with a single call, so there
+    are only a few large writes, and at most one block is
+    held in memory at a time.
+    '''
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, WRITE_CHUNK_LINES))
+        if len(chunk) == 0:
+            break
+        out_file.write("".join(chunk))
 
 
 def write_points(pts: list[point.Point], out_file):
     ''' write a list of points to the given file '''
-    for pt in pts:
-        out_file.write(f"{str(pt)}\n")
+    write_lines((f"({pt.x},{pt.y})\n" for pt in pts), out_file)
 
 
 def read_points(in_file) -> list[point.Point]:
     ''' read a list of points from the given file '''
-    pts = []
-    for line in in_file:
-        pt = point.parse_point(line.strip())
-        pts.append(pt)
-    return pts
+    return point.parse_points(in_file.read())
+
+
+# Binary point files start with this magic number and the
+# number of points, followed by the points themselves as
+# little-endian int32 x/y pairs.
+BINARY_MAGIC: bytes = b"PTSBIN01"
+BINARY_HEADER: struct.Struct = struct.Struct("<8sQ")
+
+
+def is_binary_file(filename: str) -> bool:
+    ''' check whether the given file is a binary point file '''
+    with open(filename, "rb") as in_file:
+        return in_file.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def write_binary_points(pts: list[point.Point], out_file):
+    ''' write a list of points to the given file in binary
+
+    out_file must be opened in binary mode.
+    '''
+    coords = array("i")
+    for pt in pts:
+        coords.append(pt.x)
+        coords.append(pt.y)
+    if sys.byteorder != "little":
+        coords.byteswap()
+    out_file.write(BINARY_HEADER.pack(BINARY_MAGIC, len(pts)))
+    out_file.write(coords.tobytes())
+
+
+def map_binary_coords(filename: str) -> memoryview:
+    ''' memory-map a binary point file
+
+    Returns a flat view of the coordinates (x0, y0, x1, y1, ...)
+    that refers directly to the mapped file, so nothing is
+    copied on a little-endian machine.
+    '''
+    with open(filename, "rb") as in_file:
+        data = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, num_pts = BINARY_HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC:
+        raise ValueError(f"map_binary_coords: {filename} is not a binary point file")
+    if len(data) != BINARY_HEADER.size + 8 * num_pts:
+        raise ValueError(f"map_binary_coords: {filename} does not hold {num_pts} points")
+
+    coords = memoryview(data)[BINARY_HEADER.size:].cast("i")
+    if sys.byteorder != "little":
+        swapped = array("i", coords)
+        swapped.byteswap()
+        coords = memoryview(swapped)
+    return coords
+
+
+def read_binary_points(filename: str) -> list[point.Point]:
+    ''' read a list of points from the given binary file '''
+    coords = iter(map_binary_coords(filename))
+    return [point.Point(x, y) for x, y in zip(coords, coords)]
+
+
+def load_points(filename: str) -> list[point.Point]:
+    ''' read a list of points from a text or binary file
+
+    The format is detected from the magic number.
+    '''
+    if is_binary_file(filename):
+        return read_binary_points(filename)
+    with open(filename, "r", encoding="utf_8") as in_file:
+        return read_points(in_file)
@@ -0,0 +1,139 @@
+'''
+    csr_bench.py
+
+    Micro-benchmark of visiting every neighbor of every vertex,
+    the inner loop of Dijkstra's algorithm, with a Graph and
+    with a CSRGraph built from it.
+
+    With a Graph, each visit calls adj(), which copies the
+    vertex's list of edges.  With a CSRGraph, each visit either
+    takes memoryview slices of its arrays with neighbors(), or
+    indexes them over edge_range().  The time to build each
+    graph from the edge file, and the memory each one takes,
+    are printed as well.  Each time is the best of three runs.
+'''
+import sys
+import time
+import tracemalloc
+
+from typing import Any
+
+from csr_graph import CSRGraph
+from graph import Graph
+
+
+REPEAT = 3
+
+
+def load_graph(filename: str) -> Graph:
+    ''' Read an undirected Graph from a file written by create_graph.py '''
+    graph = Graph(False)
+    with open(filename, "r", encoding="utf_8") as in_file:
+        for line in in_file:
+            fields = line.split()
+            if len(fields) == 3:
+                graph.add_edge(fields[0], fields[1], float(fields[2]))
+    return graph
+
+
+def best_time(func) -> tuple[float, Any]:
+    ''' Run func REPEAT times, and return the smallest CPU
+    time, and the result of the last run.
+    '''
+    best = float("inf")
+    result = None
+    for _ in range(REPEAT):
+        start = time.process_time()
+        result = func()
+        best = min(best, time.process_time() - start)
+    return best, result
+
+
+def visit_graph(graph: Graph) -> float:
+    ''' Visit every edge from every vertex of a Graph,
+    returning the total weight.
+    '''
+    total = 0.0
+    for v in graph.vertices():
+        for _, _, weight in graph.adj(v):
+            total += weight
+    return total
+
+
+def visit_csr_neighbors(graph: CSRGraph) -> float:
+    ''' Visit every edge from every vertex of a CSRGraph
+    with neighbors(), returning the total weight.
+    '''
+    total = 0.0
+    for v_id in range(graph.num_vertices()):
+        targets, weights = graph.neighbors(v_id)
+        for _, weight in zip(targets, weights):
+            total += weight
+    return total
+
+
+def visit_csr_edge_range(graph: CSRGraph) -> float:
+    ''' Visit every edge from every vertex of a CSRGraph
+    with edge_range(), returning the total weight.
+    '''
+    total = 0.0
+    targets = graph.targets
+    weights = graph.weights
+    for v_id in range(graph.num_vertices()):
+        for i in graph.edge_range(v_id):
+            _ = targets[i]
+            total += weights[i]
+    return total
+
+
+def traced_size(func) -> tuple[int, Any]:
+    ''' Run func with tracemalloc tracing, and return the
+    memory still allocated afterwards, and the result.
+    '''
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+
+def main(argv):
+    ''' main function '''
+    if len(argv) < 2:
+        print("usage: csr_bench <graphfile>")
+        print("    Times visiting the neighbors of every vertex in the graph")
+        print("    in <graphfile>, written by create_graph.py, with a Graph")
+        print("    and with a CSRGraph.")
+        sys.exit()
+
+    load_time, graph = best_time(lambda: load_graph(argv[1]))
+    from_graph_time, csr_graph = best_time(lambda: CSRGraph.from_graph(graph))
+    from_file_time, file_csr_graph = best_time(lambda: CSRGraph.from_edge_file(argv[1]))
+    if str(file_csr_graph) != str(csr_graph):
+        print("csr_bench: from_graph() and from_edge_file() built different graphs")
+        sys.exit(1)
+
+    graph_size, _ = traced_size(lambda: load_graph(argv[1]))
+    csr_size, _ = traced_size(lambda: CSRGraph.from_graph(graph))
+
+    num_visits = len(csr_graph.targets)
+    graph_time, graph_total = best_time(lambda: visit_graph(graph))
+    neighbors_time, neighbors_total = best_time(lambda: visit_csr_neighbors(csr_graph))
+    edge_range_time, edge_range_total = best_time(lambda: visit_csr_edge_range(csr_graph))
+    if not graph_total == neighbors_total == edge_range_total:
+        print("csr_bench: the graphs have different total weights")
+        sys.exit(1)
+
+    print(f"{csr_graph.num_vertices()} vertices, {csr_graph.num_edges()} edges")
+    print(f"    load Graph                  {load_time:8.3f}s  {graph_size / 2**20:8.1f}MB")
+    print(f"    CSRGraph.from_graph()       {from_graph_time:8.3f}s  {csr_size / 2**20:8.1f}MB")
+    print(f"    CSRGraph.from_edge_file()   {from_file_time:8.3f}s")
+    for name, visit_time in (("Graph.adj()", graph_time),
+                             ("CSRGraph.neighbors()", neighbors_time),
+                             ("CSRGraph.edge_range()", edge_range_time)):
+        print(f"    visit {name:21} {visit_time:8.3f}s  "
+              f"{1e9 * visit_time / num_visits:6.1f}ns per edge")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
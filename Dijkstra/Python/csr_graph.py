@@ -0,0 +1,155 @@
+'''
+    CSRGraph class
+
+    A frozen graph in compressed sparse row form, for algorithms
+    such as Dijkstra's that visit the neighbors of each vertex
+    many times and never change the graph.
+
+    The vertices are given dense integer ids, 0 to n-1, in the
+    order they were added.  The neighbors of vertex id v are
+    targets[offsets[v]:offsets[v+1]], and the weights of the
+    edges to them are the same slice of weights.  All three are
+    arrays, and neighbors() returns memoryview slices of them,
+    so nothing is copied when a vertex is visited; edge_range()
+    gives the indices of the slice instead.
+'''
+
+from array import array
+from typing import Any
+
+from graph import Graph
+
+
+class CSRGraph:
+    ''' Represents a graph using compressed sparse rows '''
+
+    def __init__(self, vertices: list[Any], offsets: array, targets: array,
+                 weights: array, directed: bool) -> None:
+        ''' Wrap arrays already in CSR form; see from_graph()
+        and from_edge_file() for the usual ways to build one.
+        '''
+        self._vertices = vertices
+        self._ids: dict[Any, int] = {v: i for i, v in enumerate(vertices)}
+        self._directed = directed
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._targets_view = memoryview(targets)
+        self._weights_view = memoryview(weights)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> 'CSRGraph':
+        ''' Build a CSRGraph with the same vertices and edges as graph,
+        with each vertex's neighbors in the order graph.adj() gives them.
+        '''
+        vertices: list[Any] = graph.vertices()
+        ids: dict[Any, int] = {v: i for i, v in enumerate(vertices)}
+        offsets: array = array("q", [0])
+        targets: array = array("i")
+        weights: array = array("d")
+        for v in vertices:
+            for v_from, v_to, weight in graph.adj(v):
+                # An undirected edge is in the lists of both of its
+                # vertices, the same way round in each.
+                targets.append(ids[v_to] if v_from == v else ids[v_from])
+                weights.append(weight)
+            offsets.append(len(targets))
+        return cls(vertices, offsets, targets, weights, graph.is_directed())
+
+    @classmethod
+    def from_edge_file(cls, filename: str, directed: bool = False) -> 'CSRGraph':
+        ''' Build a CSRGraph from a file of edges, one per line, in
+        the format written by create_graph.py:
+
+            <vertex> <vertex> <weight>
+
+        The vertices are the strings in the file.  The result is
+        the same as adding the edges to a Graph in file order and
+        calling from_graph(), without building the Graph.
+        '''
+        ids: dict[str, int] = {}
+        sources: array = array("i")
+        dests: array = array("i")
+        edge_weights: array = array("d")
+        with open(filename, "r", encoding="utf_8") as in_file:
+            for line_num, line in enumerate(in_file, 1):
+                fields = line.split()
+                if len(fields) == 0:
+                    continue
+                if len(fields) != 3:
+                    raise ValueError(f"{filename}:{line_num}: expected '<vertex> <vertex> <weight>'")
+                v_from: int = ids.setdefault(fields[0], len(ids))
+                v_to: int = ids.setdefault(fields[1], len(ids))
+                sources.append(v_from)
+                dests.append(v_to)
+                edge_weights.append(float(fields[2]))
+
+        # Count the edges in each vertex's list, and turn the
+        # counts into the offsets of the lists.
+        num_vertices: int = len(ids)
+        offsets: array = array("q", [0]) * (num_vertices + 1)
+        for v_from in sources:
+            offsets[v_from + 1] += 1
+        if not directed:
+            for v_to in dests:
+                offsets[v_to + 1] += 1
+        for v in range(num_vertices):
+            offsets[v + 1] += offsets[v]
+
+        # Fill in the lists, keeping the edges in file order.
+        targets: array = array("i", [0]) * offsets[num_vertices]
+        weights: array = array("d", [0.0]) * offsets[num_vertices]
+        next_slot: array = offsets[:-1]
+        for v_from, v_to, weight in zip(sources, dests, edge_weights):
+            slot = next_slot[v_from]
+            targets[slot] = v_to
+            weights[slot] = weight
+            next_slot[v_from] = slot + 1
+            if not directed:
+                slot = next_slot[v_to]
+                targets[slot] = v_from
+                weights[slot] = weight
+                next_slot[v_to] = slot + 1
+        return cls(list(ids), offsets, targets, weights, directed)
+
+    def num_vertices(self) -> int:
+        ''' Return the number of vertices '''
+        return len(self._vertices)
+
+    def num_edges(self) -> int:
+        ''' Return the number of edges '''
+        if self._directed:
+            return len(self.targets)
+        return len(self.targets) // 2
+
+    def vertex_id(self, v: Any) -> int:
+        ''' Return the id of the given vertex '''
+        return self._ids[v]
+
+    def vertex(self, v_id: int) -> Any:
+        ''' Return the vertex with the given id '''
+        return self._vertices[v_id]
+
+    def neighbors(self, v_id: int) -> tuple[memoryview, memoryview]:
+        ''' Return the ids of the neighbors of the vertex with the
+        given id, and the weights of the edges to them, as two
+        memoryviews into the graph's arrays.
+        '''
+        start = self.offsets[v_id]
+        end = self.offsets[v_id + 1]
+        return self._targets_view[start:end], self._weights_view[start:end]
+
+    def edge_range(self, v_id: int) -> range:
+        ''' Return the range of indices into targets and weights
+        of the edges from the vertex with the given id.
+
+        In pure Python, indexing the arrays over this range is
+        usually faster than iterating over the views from
+        neighbors(), since it creates one range per vertex
+        instead of two memoryviews and a tuple.
+        '''
+        return range(self.offsets[v_id], self.offsets[v_id + 1])
+
+    def __str__(self):
+        return str({self._vertices[v]: [(self._vertices[t], w) for t, w in zip(*self.neighbors(v))]
+                    for v in range(len(self._vertices))})
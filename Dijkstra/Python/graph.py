@@ -48,5 +48,13 @@ class Graph:
         else:
             return []
 
+    def vertices(self) -> list[Any]:
+        ''' Return the vertices, in the order they were added '''
+        return list(self._adj)
+
+    def is_directed(self) -> bool:
+        ''' Return True if the graph is directed '''
+        return self._directed
+
     def __str__(self):
         return str(self._adj)
@@ -0,0 +1,129 @@
+
+import numpy as np
+
+from point import Points
+
+
+def min_point(pts: Points) -> int:
+    ''' Return the index of the point in pts
+    with the smallest y coordinate, with ties
+    broken by smallest x coordinate.
+
+    This assumes pts is not empty.
+    '''
+    ys = pts[:, 1]
+    candidates = np.flatnonzero(ys == ys.min())
+    return int(candidates[np.argmin(pts[candidates, 0])])
+
+
+def sort_keys(p0: Points, pts: Points, sort_mode: str) -> tuple[Points, Points]:
+    ''' Compute the primary and secondary sort keys
+    for pts around p0, for all points at once.
+
+    The secondary key is always the manhattan distance.
+    For sort_mode "angle" the primary key is the angle
+    from np.arctan2; for "slope" it is the exact integer
+    slope key used by the other Python versions
+    (see python_ref/point.py for the details).
+
+    The points may be int32, as read_points() returns them
+    for a binary file; the keys are computed in int64, since
+    the slope key's dx << 32 would overflow int32.
+    '''
+    dx = pts[:, 0].astype(np.int64) - int(p0[0])
+    dy = pts[:, 1].astype(np.int64) - int(p0[1])
+    dist = np.abs(dx) + np.abs(dy)
+    if sort_mode == "slope":
+        # Points level with p0 must sort first; avoid
+        # dividing by zero for them.
+        flat = dy == 0
+        key = (-dx << 32) // np.where(flat, 1, dy)
+        key[flat] = np.iinfo(np.int64).min
+    else:
+        key = np.arctan2(dy, dx)
+    return key, dist
+
+
+def cull_interior(pts: Points) -> Points:
+    ''' Akl-Toussaint heuristic: remove the points that
+    cannot be on the convex hull.
+
+    This is the same test as cull_interior() in the other
+    Python versions, done for all points at once.  Points
+    strictly inside the octagon formed by the extreme points
+    in x, y, x+y and x-y are dropped; the rest keep their
+    original order.  The tests are done in int64, so that
+    int32 points do not overflow.
+    '''
+    if len(pts) < 3:
+        return pts.copy()
+
+    xs = pts[:, 0].astype(np.int64)
+    ys = pts[:, 1].astype(np.int64)
+    sums = xs + ys
+    diffs = xs - ys
+    extremes = np.column_stack((xs, ys))[[
+        np.argmin(ys), np.argmax(diffs), np.argmax(xs), np.argmax(sums),
+        np.argmax(ys), np.argmin(diffs), np.argmin(xs), np.argmin(sums)]]
+
+    # Drop repeated vertices, including a wrap-around repeat.
+    distinct = np.any(extremes != np.roll(extremes, 1, axis=0), axis=1)
+    octagon = extremes[distinct]
+    if len(octagon) < 3:
+        return pts.copy()
+
+    inside = np.ones(len(pts), dtype=bool)
+    for a, b in zip(octagon, np.roll(octagon, -1, axis=0)):
+        inside &= (b[0] - a[0]) * (ys - a[1]) - (b[1] - a[1]) * (xs - a[0]) > 0
+    return pts[~inside]
+
+
+def graham(orig_pts: Points, sort_mode: str = "angle") -> Points:
+    ''' NumPy implementation of the Graham Scan algorithm
+    for finding the convex hull of a set of points
+    in a plan.
+
+    The points are an (N, 2) int64 or int32 array, and
+    the hull is returned as an int64 array.  The sort keys are
+    computed for all points at once and the points are
+    ordered with np.lexsort; only the scan itself runs
+    in Python.
+
+    sort_mode is "angle" or "slope", as in the other
+    Python versions.
+    '''
+    if sort_mode not in ("angle", "slope"):
+        raise ValueError(f"graham: unknown sort mode '{sort_mode}'")
+
+    min_idx: int = min_point(orig_pts)
+    p0 = orig_pts[min_idx]
+    pts = np.delete(orig_pts, min_idx, axis=0)
+
+    # np.lexsort sorts by the last key first, so points
+    # with identical angles are sorted by distance from p0.
+    key, dist = sort_keys(p0, pts, sort_mode)
+    pts = pts[np.lexsort((dist, key))]
+
+    # The scan touches each point once, so it is done
+    # on plain lists of ints rather than on the array.
+    hull_x: list[int] = [int(p0[0])]
+    hull_y: list[int] = [int(p0[1])]
+    for x, y in zip(pts[:, 0].tolist(), pts[:, 1].tolist()):
+        while len(hull_x) > 1 and \
+                (hull_x[-1] - hull_x[-2]) * (y - hull_y[-2]) - \
+                (hull_y[-1] - hull_y[-2]) * (x - hull_x[-2]) <= 0:
+            hull_x.pop()
+            hull_y.pop()
+        hull_x.append(x)
+        hull_y.append(y)
+    return np.column_stack((hull_x, hull_y)).astype(np.int64)
+
+
+def main() -> None:
+    pts: Points = np.array([(-1, 0), (0, 1), (0, -1), (1, 0)], dtype=np.int64)
+    hull = graham(pts)
+    print(hull)
+
+
+if __name__ == "__main__":
+    main()
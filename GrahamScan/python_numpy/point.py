@@ -0,0 +1,17 @@
+''' Definition of a Point.
+
+In the NumPy version there is no per-point object at all.
+A set of points is an (N, 2) array of int64, with the
+x coordinates in column 0 and the y coordinates in
+column 1.  A single point is one row of that array.
+Points read from a binary file are an int32 view of the
+mapped file instead; see main.read_points().
+'''
+
+from typing import TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+Points: TypeAlias = npt.NDArray[np.int64] | npt.NDArray[np.int32]
+''' type Points = npt.NDArray[np.int64] | npt.NDArray[np.int32] '''
@@ -1,4 +1,8 @@
 
+from functools import partial
+from itertools import compress
+from operator import add
+from operator import sub
 from typing import Callable
 import math
 
@@ -43,24 +47,153 @@ def manhattan_distance(p0, pt) -> int:
     return abs((pt[0] - p0[0])) + abs((pt[1] - p0[1]))
 
 
-def graham(orig_pts: list[Point]) -> list[Point]:
+def slope(p0: Point, pt: Point) -> int:
+    ''' Compute an exact integer sort key for pt around p0.
+
+    This assumes p0 is the lowest point (smallest y, ties
+    broken by smallest x), so pt-p0 has an angle in [0, pi).
+    Over that range the angle increases with -dx/dy, so we
+    scale that slope by 2**32 and floor it.  Since dx and dy
+    are limited to 46340 (see README.md), the product of
+    two dy values is less than 2**32, so two different
+    slopes never floor to the same value, and two equal
+    slopes always do.
+
+    The manhattan distance fits in the low 17 bits, so
+    points with the same slope are ordered by distance.
+    '''
+    dx = pt[0] - p0[0]
+    dy = pt[1] - p0[1]
+    dist = abs(dx) + abs(dy)
+    if dy == 0:
+        return dist - (1 << 66)
+    return (((-dx << 32) // dy) << 17) + dist
+
+
+def cull_interior(pts: list[Point]) -> list[Point]:
+    ''' Akl-Toussaint heuristic: remove the points that
+    cannot be on the convex hull.
+
+    The points with the smallest and largest x, y, x+y,
+    and x-y values form an octagon (possibly with fewer
+    sides) whose vertices are all on the hull.  Any point
+    strictly inside it can be dropped before the hull
+    is computed.  Points on its boundary are kept, so
+    collinear points are handled by the hull algorithm
+    exactly as before.
+
+    The returned list keeps the points in their original order.
+    '''
+    if len(pts) < 3:
+        return pts[:]
+
+    xs: list[int] = [pt[0] for pt in pts]
+    ys: list[int] = [pt[1] for pt in pts]
+    sums: list[int] = list(map(add, xs, ys))
+    diffs: list[int] = list(map(sub, xs, ys))
+
+    # The extreme points, in counterclockwise order
+    # starting with the lowest one.
+    extremes: list[Point] = [
+        pts[ys.index(min(ys))],
+        pts[diffs.index(max(diffs))],
+        pts[xs.index(max(xs))],
+        pts[sums.index(max(sums))],
+        pts[ys.index(max(ys))],
+        pts[diffs.index(min(diffs))],
+        pts[xs.index(min(xs))],
+        pts[sums.index(min(sums))],
+    ]
+
+    # Several directions can share an extreme point;
+    # a repeated vertex would give an edge of length 0.
+    octagon: list[Point] = []
+    for pt in extremes:
+        if len(octagon) == 0 or pt != octagon[-1]:
+            octagon.append(pt)
+    while len(octagon) > 1 and octagon[-1] == octagon[0]:
+        octagon.pop()
+    if len(octagon) < 3:
+        return pts[:]
+
+    # For each edge a->b, ccw(a, b, pt) > 0 can be written as
+    # ea * x + eb * y > ec.  Repeating edges is harmless, so
+    # we always have exactly eight of them, which lets us
+    # write the test out in full below.
+    edges: list[tuple[int, int, int]] = []
+    for i in range(8):
+        a: Point = octagon[i % len(octagon)]
+        b: Point = octagon[(i + 1) % len(octagon)]
+        ea: int = a[1] - b[1]
+        eb: int = b[0] - a[0]
+        edges.append((ea, eb, ea * a[0] + eb * a[1]))
+    (a0, b0, c0), (a1, b1, c1), (a2, b2, c2), (a3, b3, c3), \
+        (a4, b4, c4), (a5, b5, c5), (a6, b6, c6), (a7, b7, c7) = edges
+
+    keep: list[bool] = [
+        a0 * x + b0 * y <= c0 or a1 * x + b1 * y <= c1 or
+        a2 * x + b2 * y <= c2 or a3 * x + b3 * y <= c3 or
+        a4 * x + b4 * y <= c4 or a5 * x + b5 * y <= c5 or
+        a6 * x + b6 * y <= c6 or a7 * x + b7 * y <= c7
+        for x, y in zip(xs, ys)]
+    return list(compress(pts, keep))
+
+
+def sort_keys(p0: Point, pts: list[Point]) -> tuple[list[float], list[int]]:
+    ''' Compute the angle and manhattan distance from p0
+    for every point in pts.
+
+    This does the same work as angle() and manhattan_distance(),
+    but for all of the points at once, with no Python-level
+    call per point.
+    '''
+    x0: int = p0[0]
+    y0: int = p0[1]
+    dxs: list[int] = [pt[0] - x0 for pt in pts]
+    dys: list[int] = [pt[1] - y0 for pt in pts]
+    angles: list[float] = list(map(math.atan2, dys, dxs))
+    dists: list[int] = list(map(add, map(abs, dxs), map(abs, dys)))
+    return angles, dists
+
+
+def graham(orig_pts: list[Point], sort_mode: str = "angle") -> list[Point]:
     ''' Python implementation of the Graham Scan algorithm
     for finding the convex hull of a set of points
     in a plan.
 
     A point is defined as a 2-element tuple, in the
     form (x, y).
+
+    sort_mode selects how the points are ordered around p0:
+    "angle" uses math.atan2 and the manhattan distance,
+    while "slope" uses the exact integer key from slope().
+    Both produce the same hull.
     '''
+    if sort_mode not in ("angle", "slope"):
+        raise ValueError(f"graham: unknown sort mode '{sort_mode}'")
+
     min_idx: int = min_point(orig_pts)
     p0: Point = orig_pts[min_idx]
     pts = orig_pts[:min_idx] + orig_pts[min_idx+1:]
 
     hull: list[Point] = [p0]
 
-    # The lambda here returns a tuple containing the angle
-    # and the distance; that way, points with identical angles
-    # are sorted by distance from p0.
-    pts.sort(key = lambda pt : (angle(p0, pt), manhattan_distance(p0, pt)))
+    # The slope key packs the angle and the distance into
+    # a single integer, so points with identical angles are
+    # sorted by distance from p0.
+    if sort_mode == "slope":
+        pts.sort(key = partial(slope, p0))
+    else:
+        # The keys for every point are computed up front, and
+        # the indices are sorted twice, first by distance and then
+        # by angle.  Python's sort is stable, so points with
+        # identical angles stay sorted by distance from p0.
+        # Sorting on one plain float or int at a time is much
+        # faster than comparing (angle, distance) tuples.
+        angles, dists = sort_keys(p0, pts)
+        order: list[int] = sorted(range(len(pts)), key = dists.__getitem__)
+        order.sort(key = angles.__getitem__)
+        pts = [pts[i] for i in order]
 
     for pt in pts:
         while len(hull) > 1 and ccw(hull[-2], hull[-1], pt) <= 0:
@@ -69,10 +202,46 @@ def graham(orig_pts: list[Point]) -> list[Point]:
     return hull
 
 
+def monotone_chain(orig_pts: list[Point]) -> list[Point]:
+    ''' Python implementation of Andrew's monotone chain
+    algorithm for finding the convex hull of a set of points.
+
+    The points are sorted by (x, y) with a plain
+    tuple compare, so no key function is needed.
+    The lower and upper hulls are built in the same pass.
+
+    The hull is returned in the same form as graham():
+    counterclockwise, starting at the point returned
+    by min_point().
+    '''
+    pts: list[Point] = sorted(orig_pts)
+
+    lower: list[Point] = []
+    upper: list[Point] = []
+    for pt in pts:
+        while len(lower) > 1 and ccw(lower[-2], lower[-1], pt) <= 0:
+            lower.pop()
+        lower.append(pt)
+        while len(upper) > 1 and ccw(upper[-2], upper[-1], pt) >= 0:
+            upper.pop()
+        upper.append(pt)
+
+    # Both chains run from the leftmost point to the rightmost
+    # point, so walk the upper one backwards, leaving out the
+    # points the chains share.
+    hull: list[Point] = lower + upper[-2:0:-1]
+
+    # Rotate the hull so it starts at the same point as graham().
+    min_idx: int = min_point(hull)
+    return hull[min_idx:] + hull[:min_idx]
+
+
 def main() -> None:
     pts: list[Point] = [(-1, 0), (0, 1), (0, -1), (1, 0)]
     hull = graham(pts)
     print(hull)
+    hull = monotone_chain(pts)
+    print(hull)
 
 
 if __name__ == "__main__":
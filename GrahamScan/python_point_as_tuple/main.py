@@ -1,67 +1,188 @@
 
-from io import TextIOWrapper
+from array import array
+from io import BufferedReader
+import mmap
+import re
+import struct
 import sys
 import time
 from typing import Any
 
+from graham import cull_interior
 from graham import graham
+from graham import monotone_chain
 from point import Point
 
 
-def read_points(filename: str) -> list[Point]:
-    pts_file: TextIOWrapper = open(filename, "r")
+# A line that is not blank, not a comment, and not exactly
+# in the format written by write_points().
+_IRREGULAR_LINE = re.compile(rb"^(?!\(-?\d+,-?\d+\)\r?$|[ \t\r]*$|#)", re.M)
+_COMMENT_LINE = re.compile(rb"^#.*$", re.M)
+_SEPARATORS = bytes.maketrans(b"(),", b"   ")
+
+
+def parse_point(line: str) -> Point:
+    if line[0] != "(":
+        raise ValueError("parse_point: does not start with '('")
+    if line[-1] != ")":
+        raise ValueError("parse_point: does not end with ')'")
+
+    fields = line[1:-1].replace(" ", "").split(',')
+    if len(fields) != 2:
+        raise ValueError(f"parse_point: {len(fields)} fields found, 2 expected")
+    return (int(fields[0]), int(fields[1]))
+
+
+def parse_points(data: bytes) -> list[Point]:
+    ''' Convert the contents of a point file to a list of points.
+
+    Blank lines and lines starting with '#' are skipped.
+    If every other line is exactly in the format written
+    by write_points(), all of the coordinates are pulled
+    out of the data in a single pass.  Otherwise each line
+    is given to parse_point(), so a malformed line raises
+    the same error it always has.
+    '''
+    if _IRREGULAR_LINE.search(data) is None:
+        if b"#" in data:
+            data = _COMMENT_LINE.sub(b"", data)
+        coords = iter(map(int, data.translate(_SEPARATORS).split()))
+        return list(zip(coords, coords))
+
     pts: list[Point] = []
-    for line in pts_file:
+    for line in data.decode().splitlines():
+        line = line.strip()
         if len(line) == 0: continue
         if line[0] == "#": continue
-        line = line.strip()
-        if line[0] != "(":
-            raise ValueError("parse_point: does not start with '('")
-        if line[-1] != ")":
-            raise ValueError("parse_point: does not end with ')'")
-
-        fields = line[1:-1].replace(" ", "").split(',')
-        if len(fields) != 2:
-            raise ValueError(f"parse_point: {len(fields)} fields found, 2 expected")
-        pt: Point = (int(fields[0]), int(fields[1]))
-        pts.append(pt)
+        pts.append(parse_point(line))
     return pts
 
 
+# Binary point files start with this magic number and the
+# number of points, followed by the points themselves as
+# little-endian int32 x/y pairs.  See tests/convert_points.py.
+BINARY_MAGIC: bytes = b"PTSBIN01"
+BINARY_HEADER: struct.Struct = struct.Struct("<8sQ")
+
+
+def is_binary_file(filename: str) -> bool:
+    pts_file: BufferedReader = open(filename, "rb")
+    magic: bytes = pts_file.read(len(BINARY_MAGIC))
+    pts_file.close()
+    return magic == BINARY_MAGIC
+
+
+def map_binary_coords(filename: str) -> memoryview:
+    ''' Memory-map a binary point file.
+
+    Returns a flat view of the coordinates (x0, y0, x1, y1, ...)
+    that refers directly to the mapped file, so nothing is
+    copied on a little-endian machine.
+    '''
+    pts_file: BufferedReader = open(filename, "rb")
+    data: mmap.mmap = mmap.mmap(pts_file.fileno(), 0, access=mmap.ACCESS_READ)
+    pts_file.close()
+
+    magic, num_pts = BINARY_HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC:
+        raise ValueError(f"map_binary_coords: {filename} is not a binary point file")
+    if len(data) != BINARY_HEADER.size + 8 * num_pts:
+        raise ValueError(f"map_binary_coords: {filename} does not hold {num_pts} points")
+
+    coords: memoryview = memoryview(data)[BINARY_HEADER.size:].cast("i")
+    if sys.byteorder != "little":
+        swapped: array = array("i", coords)
+        swapped.byteswap()
+        coords = memoryview(swapped)
+    return coords
+
+
+def read_points(filename: str) -> list[Point]:
+    if is_binary_file(filename):
+        coords = iter(map_binary_coords(filename))
+        return list(zip(coords, coords))
+
+    pts_file: BufferedReader = open(filename, "rb")
+    data: bytes = pts_file.read()
+    pts_file.close()
+    return parse_points(data)
+
+
 def write_points(pts: list[Point], filename: str = "") -> None:
     ''' Write a list of points to a file.
     
     If filename is a blank string, stdout is used.
+    The text is built first and written with a single call.
     '''
     if filename != "":
         pts_file: Any = open(filename, "w")
     else:
         pts_file = sys.stdout
 
-    for pt in pts:
-        pts_file.write(f"({pt[0]},{pt[1]})\n")
+    pts_file.write("".join([f"({pt[0]},{pt[1]})\n" for pt in pts]))
 
     if filename != "":
         pts_file.close()
 
 
+ENGINES: tuple[str, ...] = ("graham", "monotone")
+
+
+def compute_hull(pts: list[Point], engine: str = "graham", sort_mode: str = "angle") -> list[Point]:
+    ''' Compute the convex hull of pts with the named engine.
+
+    sort_mode is only used by graham().
+    '''
+    if engine not in ENGINES:
+        raise ValueError(f"compute_hull: unknown engine '{engine}'")
+    if engine == "monotone":
+        return monotone_chain(pts)
+    return graham(pts, sort_mode)
+
+
 def main() -> None:
-    if len(sys.argv) == 1:
-        print("usage: main <infile> [<outfile>]")
+    # Options start with "--"; everything else is positional.
+    args: list[str] = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    opts: list[str] = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+
+    if len(args) == 0:
+        print("usage: main [--engine=graham|monotone] [--sort=angle|slope] [--cull] <infile> [<outfile>]")
         sys.exit()
 
-    infile:str = sys.argv[1]
+    engine: str = "graham"
+    sort_mode: str = "angle"
+    cull: bool = False
+    for opt in opts:
+        if opt.startswith("--engine="):
+            engine = opt[len("--engine="):]
+        elif opt.startswith("--sort="):
+            sort_mode = opt[len("--sort="):]
+        elif opt == "--cull":
+            cull = True
+        else:
+            print(f"main: unknown option '{opt}'")
+            sys.exit(1)
+    if engine not in ENGINES:
+        print(f"main: unknown engine '{engine}'")
+        sys.exit(1)
+
+    infile:str = args[0]
     outfile: str = ""
-    if len(sys.argv) > 2:
-        outfile = sys.argv[2]
+    if len(args) > 1:
+        outfile = args[1]
 
     pts: list[Point] = read_points(infile)
     start: float = time.thread_time()
-    hull = graham(pts)
+    num_pts: int = len(pts)
+    if cull:
+        pts = cull_interior(pts)
+    hull = compute_hull(pts, engine, sort_mode)
     end: float = time.thread_time()
 
     write_points(hull, outfile)
     print(f"{end-start:.4f}")
+    if cull:
+        print(f"culled {num_pts - len(pts)} of {num_pts} points", file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+
+from operator import attrgetter
+from itertools import compress
+from operator import add
+from operator import sub
+from typing import Callable
+import math
+
+from point import Point
+
+
+def min_point(pts: list[Point]) -> int:
+    ''' Return the index of the point in pts
+    with the smallest y coordinate, with ties
+    broken by smallest x coordinate.
+
+    This assumes pts is not empty.
+    '''
+    key: Callable = lambda pt : (pt.y, pt.x)
+    min_idx: int = 0
+    for i in range(1, len(pts)):
+        if key(pts[i]) < key(pts[min_idx]):
+            min_idx = i
+    return min_idx
+
+
+def ccw(pt1: Point, pt2: Point, pt3: Point) -> int:
+    ''' Determine the direction of the turn along
+     the path pt1 to pt2 to pt3.
+     '''
+    dx21 = pt2.x - pt1.x
+    dy31 = pt3.y - pt1.y
+    dy21 = pt2.y - pt1.y
+    dx31 = pt3.x - pt1.x
+    return dx21 * dy31 - dy21 * dx31
+
+
+def cull_interior(pts: list[Point]) -> list[Point]:
+    ''' Akl-Toussaint heuristic: remove the points that
+    cannot be on the convex hull.
+
+    The points with the smallest and largest x, y, x+y,
+    and x-y values form an octagon (possibly with fewer
+    sides) whose vertices are all on the hull.  Any point
+    strictly inside it can be dropped before the hull
+    is computed.  Points on its boundary are kept, so
+    collinear points are handled by the hull algorithm
+    exactly as before.
+
+    The returned list keeps the points in their original order.
+    '''
+    if len(pts) < 3:
+        return pts[:]
+
+    xs: list[int] = [pt.x for pt in pts]
+    ys: list[int] = [pt.y for pt in pts]
+    sums: list[int] = list(map(add, xs, ys))
+    diffs: list[int] = list(map(sub, xs, ys))
+
+    # The extreme points, in counterclockwise order
+    # starting with the lowest one.
+    extremes: list[Point] = [
+        pts[ys.index(min(ys))],
+        pts[diffs.index(max(diffs))],
+        pts[xs.index(max(xs))],
+        pts[sums.index(max(sums))],
+        pts[ys.index(max(ys))],
+        pts[diffs.index(min(diffs))],
+        pts[xs.index(min(xs))],
+        pts[sums.index(min(sums))],
+    ]
+
+    # Several directions can share an extreme point;
+    # a repeated vertex would give an edge of length 0.
+    octagon: list[Point] = []
+    for pt in extremes:
+        if len(octagon) == 0 or (pt.x, pt.y) != (octagon[-1].x, octagon[-1].y):
+            octagon.append(pt)
+    while len(octagon) > 1 and (octagon[-1].x, octagon[-1].y) == (octagon[0].x, octagon[0].y):
+        octagon.pop()
+    if len(octagon) < 3:
+        return pts[:]
+
+    # For each edge a->b, ccw(a, b, pt) > 0 can be written as
+    # ea * x + eb * y > ec.  Repeating edges is harmless, so
+    # we always have exactly eight of them, which lets us
+    # write the test out in full below.
+    edges: list[tuple[int, int, int]] = []
+    for i in range(8):
+        a: Point = octagon[i % len(octagon)]
+        b: Point = octagon[(i + 1) % len(octagon)]
+        ea: int = a.y - b.y
+        eb: int = b.x - a.x
+        edges.append((ea, eb, ea * a.x + eb * a.y))
+    (a0, b0, c0), (a1, b1, c1), (a2, b2, c2), (a3, b3, c3), \
+        (a4, b4, c4), (a5, b5, c5), (a6, b6, c6), (a7, b7, c7) = edges
+
+    keep: list[bool] = [
+        a0 * x + b0 * y <= c0 or a1 * x + b1 * y <= c1 or
+        a2 * x + b2 * y <= c2 or a3 * x + b3 * y <= c3 or
+        a4 * x + b4 * y <= c4 or a5 * x + b5 * y <= c5 or
+        a6 * x + b6 * y <= c6 or a7 * x + b7 * y <= c7
+        for x, y in zip(xs, ys)]
+    return list(compress(pts, keep))
+
+
+def sort_keys(p0: Point, pts: list[Point]) -> tuple[list[float], list[int]]:
+    ''' Compute the angle and manhattan distance from p0
+    for every point in pts.
+
+    This does the same work as Point.angle_to() and Point.manhattan_distance(),
+    but for all of the points at once, with no Python-level
+    call per point.
+    '''
+    x0: int = p0.x
+    y0: int = p0.y
+    dxs: list[int] = [pt.x - x0 for pt in pts]
+    dys: list[int] = [pt.y - y0 for pt in pts]
+    angles: list[float] = list(map(math.atan2, dys, dxs))
+    dists: list[int] = list(map(add, map(abs, dxs), map(abs, dys)))
+    return angles, dists
+
+
+def graham(orig_pts: list[Point], sort_mode: str = "angle") -> list[Point]:
+    ''' Python implementation of the Graham Scan algorithm
+    for finding the convex hull of a set of points
+    in a plan.
+
+    A point is defined as a 2-element tuple, in the
+    form (x, y).
+
+    sort_mode selects how the points are ordered around p0:
+    "angle" uses math.atan2 and the manhattan distance,
+    while "slope" uses the exact integer key from
+    Point.slope_to().  Both produce the same hull.
+    '''
+    if sort_mode not in ("angle", "slope"):
+        raise ValueError(f"graham: unknown sort mode '{sort_mode}'")
+
+    min_idx: int = min_point(orig_pts)
+    p0: Point = orig_pts[min_idx]
+    pts = orig_pts[:min_idx] + orig_pts[min_idx+1:]
+
+    hull: list[Point] = [p0]
+
+    # The slope key packs the angle and the distance into
+    # a single integer, so points with identical angles are
+    # sorted by distance from p0.
+    if sort_mode == "slope":
+        pts.sort(key = p0.slope_to)
+    else:
+        # The keys for every point are computed up front, and
+        # the indices are sorted twice, first by distance and then
+        # by angle.  Python's sort is stable, so points with
+        # identical angles stay sorted by distance from p0.
+        # Sorting on one plain float or int at a time is much
+        # faster than comparing (angle, distance) tuples.
+        angles, dists = sort_keys(p0, pts)
+        order: list[int] = sorted(range(len(pts)), key = dists.__getitem__)
+        order.sort(key = angles.__getitem__)
+        pts = [pts[i] for i in order]
+
+    for pt in pts:
+        while len(hull) > 1 and ccw(hull[-2], hull[-1], pt) <= 0:
+            hull.pop()
+        hull.append(pt)
+    return hull
+
+
+def monotone_chain(orig_pts: list[Point]) -> list[Point]:
+    ''' Python implementation of Andrew's monotone chain
+    algorithm for finding the convex hull of a set of points.
+
+    The points are sorted by (x, y) using attrgetter,
+    so no Python-level key function is called.
+    The lower and upper hulls are built in the same pass.
+
+    The hull is returned in the same form as graham():
+    counterclockwise, starting at the point returned
+    by min_point().
+    '''
+    pts: list[Point] = sorted(orig_pts, key = attrgetter("x", "y"))
+
+    lower: list[Point] = []
+    upper: list[Point] = []
+    for pt in pts:
+        while len(lower) > 1 and ccw(lower[-2], lower[-1], pt) <= 0:
+            lower.pop()
+        lower.append(pt)
+        while len(upper) > 1 and ccw(upper[-2], upper[-1], pt) >= 0:
+            upper.pop()
+        upper.append(pt)
+
+    # Both chains run from the leftmost point to the rightmost
+    # point, so walk the upper one backwards, leaving out the
+    # points the chains share.
+    hull: list[Point] = lower + upper[-2:0:-1]
+
+    # Rotate the hull so it starts at the same point as graham().
+    min_idx: int = min_point(hull)
+    return hull[min_idx:] + hull[:min_idx]
+
+
+def main() -> None:
+    pts: list[Point] = [Point(-1, 0), Point(0, 1), Point(0, -1), Point(1, 0)]
+    hull = graham(pts)
+    print(hull)
+    hull = monotone_chain(pts)
+    print(hull)
+
+
+if __name__ == "__main__":
+    main()
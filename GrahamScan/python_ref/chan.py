@@ -0,0 +1,170 @@
+''' Chan's algorithm: an output-sensitive convex hull.
+
+The points are split into groups of m, and the hull of
+each group is found with graham().  The hull of the whole
+set is then wrapped (as in the Jarvis march) starting at
+min_point(): from each hull point q, the next one is the
+most clockwise of the tangent points from q to the group
+hulls, and each tangent is found with a binary search, so
+one step costs O((n/m) log m).  If the hull has not closed
+after m steps, m was too small, and everything is repeated
+with m squared.  The total time is O(n log h), where h
+is the number of points on the hull.
+'''
+
+from graham import ccw
+from graham import graham
+from graham import min_point
+from point import Point
+
+
+def _tangent_search(q: Point, hull: list[Point]) -> int:
+    ''' Binary search for the tangent from q to a convex polygon.
+
+    hull is counterclockwise with no collinear points, and q
+    is outside it.  Seen from q the polygon spans less than
+    half a turn, and walking around it the direction to its
+    vertices turns counterclockwise, then clockwise, then
+    counterclockwise again, so the tangent we want (the most
+    clockwise vertex) is where the walk starts turning
+    counterclockwise.  Comparing each vertex with hull[0]
+    tells which part of the walk it is in.
+    '''
+    k: int = len(hull)
+    v0: Point = hull[0]
+    up0: bool = ccw(q, v0, hull[1]) > 0
+    if up0 and ccw(q, v0, hull[-1]) >= 0:
+        return 0
+
+    lo: int = 1
+    hi: int = k - 1
+    while lo < hi:
+        mid: int = (lo + hi) // 2
+        up: bool = ccw(q, hull[mid], hull[mid + 1]) > 0
+        side: int = ccw(q, v0, hull[mid])
+        if up0:
+            # 0 is in the first counterclockwise run; the tangent
+            # starts the last one, which is clockwise of hull[0].
+            after: bool = up and side < 0
+        else:
+            # 0 is in a clockwise run; the vertices from the
+            # tangent on either turn counterclockwise or are
+            # counterclockwise of hull[0].
+            after = up or side > 0
+        if after:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _tangent(q: Point, hull: list[Point]) -> int:
+    ''' Return the index of the point t in hull such that
+    every point of hull is to the left of or on the line
+    from q to t, choosing the one farthest from q if
+    there are two.
+
+    The binary search is checked against the neighbours of
+    the point it finds; if the check fails (which only
+    happens in degenerate cases), every point is tried.
+    '''
+    k: int = len(hull)
+    t: int = 0
+    if k >= 3:
+        t = _tangent_search(q, hull)
+    if k < 3 or ccw(q, hull[t], hull[t - 1]) < 0 or ccw(q, hull[t], hull[(t + 1) % k]) < 0:
+        t = 0
+        for i in range(1, k):
+            turn: int = ccw(q, hull[t], hull[i])
+            if turn < 0 or (turn == 0 and
+                            q.manhattan_distance(hull[i]) > q.manhattan_distance(hull[t])):
+                t = i
+        return t
+
+    # The line from q to t can also pass through one of
+    # its neighbours; if so, take the farther of the two.
+    for i in ((t - 1) % k, (t + 1) % k):
+        if ccw(q, hull[t], hull[i]) == 0 and \
+                q.manhattan_distance(hull[i]) > q.manhattan_distance(hull[t]):
+            return i
+    return t
+
+
+def _wrap(groups: list[list[Point]], group: int, m: int) -> list[Point] | None:
+    ''' Wrap the hull of the group hulls, starting at the first
+    point of groups[group], which must be min_point() of all
+    of them.
+
+    Returns the hull, or None if it has more than m points.
+    '''
+    idx: int = 0
+    p0: Point = groups[group][0]
+    hull: list[Point] = [p0]
+    for _ in range(m):
+        q: Point = groups[group][idx]
+        # Within its own group, the next point after q is
+        # simply the next point on that group's hull.
+        best_group: int = group
+        best_idx: int = (idx + 1) % len(groups[group])
+        best: Point = groups[group][best_idx]
+        for g, group_hull in enumerate(groups):
+            if g == group:
+                continue
+            i: int = _tangent(q, group_hull)
+            pt: Point = group_hull[i]
+            turn: int = ccw(q, best, pt)
+            if best is q or turn < 0 or (turn == 0 and
+                                         q.manhattan_distance(pt) > q.manhattan_distance(best)):
+                best_group, best_idx, best = g, i, pt
+        if best is p0:
+            return hull
+        hull.append(best)
+        group, idx = best_group, best_idx
+    return None
+
+
+def chan(orig_pts: list[Point], sort_mode: str = "angle") -> list[Point]:
+    ''' Python implementation of Chan's algorithm for
+    finding the convex hull of a set of points.
+
+    The hull is returned in the same form as graham():
+    counterclockwise, starting at the point returned
+    by min_point(), with no collinear points.  sort_mode
+    is passed on to graham() for the group hulls.
+
+    The first round uses groups of 256 points rather than
+    the textbook 4: a round costs about the same for any
+    small m, since calling graham() once per group is most
+    of the work, and rounds with smaller groups rarely
+    find the hull.  After a round fails, only the points
+    on the group hulls are kept for the next one, since
+    no other point can be on the hull.
+    '''
+    if len(orig_pts) < 3:
+        return graham(orig_pts, sort_mode)
+
+    p0: Point = orig_pts[min_point(orig_pts)]
+    pts: list[Point] = orig_pts
+    m: int = 256
+    while True:
+        m = min(m, len(pts))
+        groups: list[list[Point]] = [graham(pts[i:i+m], sort_mode)
+                                     for i in range(0, len(pts), m)]
+        # p0 is also min_point() of its own group, so it is
+        # the first point of that group's hull.
+        group: int = next(g for g, group_hull in enumerate(groups) if group_hull[0] is p0)
+        hull: list[Point] | None = _wrap(groups, group, m)
+        if hull is not None:
+            return hull
+        pts = [pt for group_hull in groups for pt in group_hull]
+        m = m * m
+
+
+def main() -> None:
+    pts: list[Point] = [Point(-1, 0), Point(0, 1), Point(0, -1), Point(1, 0), Point(0, 0)]
+    hull = chan(pts)
+    print(hull)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,14 @@
 
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from operator import attrgetter
+from itertools import compress
+from operator import add
+from operator import sub
 from typing import Callable
 import math
+import os
 
 from point import Point
 
@@ -31,24 +39,130 @@ def ccw(pt1: Point, pt2: Point, pt3: Point) -> int:
     return dx21 * dy31 - dy21 * dx31
 
 
-def graham(orig_pts: list[Point]) -> list[Point]:
+def cull_interior(pts: list[Point]) -> list[Point]:
+    ''' Akl-Toussaint heuristic: remove the points that
+    cannot be on the convex hull.
+
+    The points with the smallest and largest x, y, x+y,
+    and x-y values form an octagon (possibly with fewer
+    sides) whose vertices are all on the hull.  Any point
+    strictly inside it can be dropped before the hull
+    is computed.  Points on its boundary are kept, so
+    collinear points are handled by the hull algorithm
+    exactly as before.
+
+    The returned list keeps the points in their original order.
+    '''
+    if len(pts) < 3:
+        return pts[:]
+
+    xs: list[int] = [pt.x for pt in pts]
+    ys: list[int] = [pt.y for pt in pts]
+    sums: list[int] = list(map(add, xs, ys))
+    diffs: list[int] = list(map(sub, xs, ys))
+
+    # The extreme points, in counterclockwise order
+    # starting with the lowest one.
+    extremes: list[Point] = [
+        pts[ys.index(min(ys))],
+        pts[diffs.index(max(diffs))],
+        pts[xs.index(max(xs))],
+        pts[sums.index(max(sums))],
+        pts[ys.index(max(ys))],
+        pts[diffs.index(min(diffs))],
+        pts[xs.index(min(xs))],
+        pts[sums.index(min(sums))],
+    ]
+
+    # Several directions can share an extreme point;
+    # a repeated vertex would give an edge of length 0.
+    octagon: list[Point] = []
+    for pt in extremes:
+        if len(octagon) == 0 or (pt.x, pt.y) != (octagon[-1].x, octagon[-1].y):
+            octagon.append(pt)
+    while len(octagon) > 1 and (octagon[-1].x, octagon[-1].y) == (octagon[0].x, octagon[0].y):
+        octagon.pop()
+    if len(octagon) < 3:
+        return pts[:]
+
+    # For each edge a->b, ccw(a, b, pt) > 0 can be written as
+    # ea * x + eb * y > ec.  Repeating edges is harmless, so
+    # we always have exactly eight of them, which lets us
+    # write the test out in full below.
+    edges: list[tuple[int, int, int]] = []
+    for i in range(8):
+        a: Point = octagon[i % len(octagon)]
+        b: Point = octagon[(i + 1) % len(octagon)]
+        ea: int = a.y - b.y
+        eb: int = b.x - a.x
+        edges.append((ea, eb, ea * a.x + eb * a.y))
+    (a0, b0, c0), (a1, b1, c1), (a2, b2, c2), (a3, b3, c3), \
+        (a4, b4, c4), (a5, b5, c5), (a6, b6, c6), (a7, b7, c7) = edges
+
+    keep: list[bool] = [
+        a0 * x + b0 * y <= c0 or a1 * x + b1 * y <= c1 or
+        a2 * x + b2 * y <= c2 or a3 * x + b3 * y <= c3 or
+        a4 * x + b4 * y <= c4 or a5 * x + b5 * y <= c5 or
+        a6 * x + b6 * y <= c6 or a7 * x + b7 * y <= c7
+        for x, y in zip(xs, ys)]
+    return list(compress(pts, keep))
+
+
+def sort_keys(p0: Point, pts: list[Point]) -> tuple[list[float], list[int]]:
+    ''' Compute the angle and manhattan distance from p0
+    for every point in pts.
+
+    This does the same work as Point.angle_to() and Point.manhattan_distance(),
+    but for all of the points at once, with no Python-level
+    call per point.
+    '''
+    x0: int = p0.x
+    y0: int = p0.y
+    dxs: list[int] = [pt.x - x0 for pt in pts]
+    dys: list[int] = [pt.y - y0 for pt in pts]
+    angles: list[float] = list(map(math.atan2, dys, dxs))
+    dists: list[int] = list(map(add, map(abs, dxs), map(abs, dys)))
+    return angles, dists
+
+
+def graham(orig_pts: list[Point], sort_mode: str = "angle") -> list[Point]:
     ''' Python implementation of the Graham Scan algorithm
     for finding the convex hull of a set of points
     in a plan.
 
     A point is defined as a 2-element tuple, in the
     form (x, y).
+
+    sort_mode selects how the points are ordered around p0:
+    "angle" uses math.atan2 and the manhattan distance,
+    while "slope" uses the exact integer key from
+    Point.slope_to().  Both produce the same hull.
     '''
+    if sort_mode not in ("angle", "slope"):
+        raise ValueError(f"graham: unknown sort mode '{sort_mode}'")
+
     min_idx: int = min_point(orig_pts)
     p0: Point = orig_pts[min_idx]
     pts = orig_pts[:min_idx] + orig_pts[min_idx+1:]
 
     hull: list[Point] = [p0]
 
-    # The lambda here returns a tuple containing the angle
-    # and the distance; that way, points with identical angles
-    # are sorted by distance from p0.
-    pts.sort(key = lambda pt : (p0.angle_to(pt), p0.manhattan_distance(pt)))
+    # The slope key packs the angle and the distance into
+    # a single integer, so points with identical angles are
+    # sorted by distance from p0.
+    if sort_mode == "slope":
+        pts.sort(key = p0.slope_to)
+    else:
+        # The keys for every point are computed up front, and
+        # the indices are sorted twice, first by distance and then
+        # by angle.  Python's sort is stable, so points with
+        # identical angles stay sorted by distance from p0.
+        # Sorting on one plain float or int at a time is much
+        # faster than comparing (angle, distance) tuples.
+        angles, dists = sort_keys(p0, pts)
+        order: list[int] = sorted(range(len(pts)), key = dists.__getitem__)
+        order.sort(key = angles.__getitem__)
+        pts = [pts[i] for i in order]
 
     for pt in pts:
         while len(hull) > 1 and ccw(hull[-2], hull[-1], pt) <= 0:
@@ -57,10 +171,114 @@ def graham(orig_pts: list[Point]) -> list[Point]:
     return hull
 
 
+def monotone_chain(orig_pts: list[Point]) -> list[Point]:
+    ''' Python implementation of Andrew's monotone chain
+    algorithm for finding the convex hull of a set of points.
+
+    The points are sorted by (x, y) using attrgetter,
+    so no Python-level key function is called.
+    The lower and upper hulls are built in the same pass.
+
+    The hull is returned in the same form as graham():
+    counterclockwise, starting at the point returned
+    by min_point().
+    '''
+    pts: list[Point] = sorted(orig_pts, key = attrgetter("x", "y"))
+
+    lower: list[Point] = []
+    upper: list[Point] = []
+    for pt in pts:
+        while len(lower) > 1 and ccw(lower[-2], lower[-1], pt) <= 0:
+            lower.pop()
+        lower.append(pt)
+        while len(upper) > 1 and ccw(upper[-2], upper[-1], pt) >= 0:
+            upper.pop()
+        upper.append(pt)
+
+    # Both chains run from the leftmost point to the rightmost
+    # point, so walk the upper one backwards, leaving out the
+    # points the chains share.
+    hull: list[Point] = lower + upper[-2:0:-1]
+
+    # Rotate the hull so it starts at the same point as graham().
+    min_idx: int = min_point(hull)
+    return hull[min_idx:] + hull[:min_idx]
+
+
+def _chunk_hull(shm_name: str, start: int, end: int, sort_mode: str) -> array:
+    ''' Worker for parallel_hull(): compute the hull of
+    points start to end-1 of the shared coordinate block.
+
+    The hull is returned as a flat array of x/y pairs,
+    which is much cheaper to send back than Point objects.
+    '''
+    shm = shared_memory.SharedMemory(name=shm_name)
+    coords: memoryview = shm.buf.cast("i")[2*start:2*end]
+    it = iter(coords)
+    pts: list[Point] = [Point(x, y) for x, y in zip(it, it)]
+    coords.release()
+    shm.close()
+
+    hull_coords: array = array("i")
+    for pt in graham(pts, sort_mode):
+        hull_coords.append(pt.x)
+        hull_coords.append(pt.y)
+    return hull_coords
+
+
+def parallel_hull(orig_pts: list[Point], workers: int = 0,
+                  sort_mode: str = "angle") -> list[Point]:
+    ''' Compute the convex hull with several processes.
+
+    The points are split into one contiguous chunk per
+    worker, and the hull of each chunk is computed in a
+    ProcessPoolExecutor.  Every point on the hull of the
+    whole set is on the hull of its own chunk, so the final
+    hull is graham() of the union of the chunk hulls, which
+    is small.
+
+    The coordinates are copied once into a shared memory
+    block, so the workers do not receive pickled Points.
+    workers defaults to os.cpu_count().
+
+    The result is the same as graham(orig_pts), except that
+    the returned Points are new objects.
+    '''
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(orig_pts))
+    if workers <= 1:
+        return graham(orig_pts, sort_mode)
+
+    coords: array = array("i", [0]) * (2 * len(orig_pts))
+    coords[0::2] = array("i", [pt.x for pt in orig_pts])
+    coords[1::2] = array("i", [pt.y for pt in orig_pts])
+    shm = shared_memory.SharedMemory(create=True, size=coords.itemsize * len(coords))
+    try:
+        shm.buf[:len(coords) * coords.itemsize] = memoryview(coords).cast("B")
+        del coords
+        bounds: list[int] = [len(orig_pts) * i // workers for i in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_chunk_hull, shm.name, bounds[i], bounds[i+1], sort_mode)
+                       for i in range(workers)]
+            candidates: list[Point] = []
+            for future in futures:
+                it = iter(future.result())
+                candidates.extend(Point(x, y) for x, y in zip(it, it))
+    finally:
+        shm.close()
+        shm.unlink()
+    return graham(candidates, sort_mode)
+
+
 def main() -> None:
     pts: list[Point] = [Point(-1, 0), Point(0, 1), Point(0, -1), Point(1, 0)]
     hull = graham(pts)
     print(hull)
+    hull = monotone_chain(pts)
+    print(hull)
+    hull = parallel_hull(pts, 2)
+    print(hull)
 
 
 if __name__ == "__main__":
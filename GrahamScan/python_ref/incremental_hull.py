@@ -0,0 +1,99 @@
+''' An online convex hull, for points that arrive over time.
+
+IncrementalHull keeps the hull as the two chains built by
+monotone_chain(): the lower and the upper hull, each sorted
+by (x, y).  A new point is located in each chain with a
+binary search, and is either rejected (it is on or inside
+the hull) or inserted, after which its neighbours that no
+longer make a strict turn are removed.  Every point is
+inserted and removed at most once, so the amortized cost
+is O(log h) comparisons per point.  The chains are plain
+lists, though, so each insertion or removal also moves up
+to h list items: the time per point is O(h) in the worst
+case, not O(log h).  The chains are sorted by (x, y), not
+by angle around a reference point as graham() sorts, so
+that the reference point never has to change.
+
+Points that are rejected can never be on the hull later,
+so they are not kept.
+'''
+
+from bisect import bisect_left
+from operator import attrgetter
+from typing import Callable
+
+from graham import ccw
+from graham import min_point
+from point import Point
+
+
+class IncrementalHull:
+    _key: Callable = attrgetter("x", "y")
+
+    def __init__(self, pts: list[Point] | None = None) -> None:
+        self._lower: list[Point] = []
+        self._upper: list[Point] = []
+        if pts is not None:
+            self.add_many(pts)
+
+    @classmethod
+    def _insert(cls, chain: list[Point], pt: Point, sign: int) -> bool:
+        ''' Add pt to one chain, if it belongs there.
+
+        sign is 1 for the lower chain, where consecutive
+        points turn counterclockwise, and -1 for the upper
+        chain, where they turn clockwise.  Returns True if
+        pt was added.
+        '''
+        i: int = bisect_left(chain, (pt.x, pt.y), key = cls._key)
+        if i < len(chain) and chain[i].x == pt.x and chain[i].y == pt.y:
+            return False
+        if 0 < i < len(chain) and sign * ccw(chain[i-1], chain[i], pt) >= 0:
+            return False
+
+        chain.insert(i, pt)
+        while i > 1 and sign * ccw(chain[i-2], chain[i-1], pt) <= 0:
+            del chain[i-1]
+            i -= 1
+        while i < len(chain) - 2 and sign * ccw(pt, chain[i+1], chain[i+2]) <= 0:
+            del chain[i+1]
+        return True
+
+    def add(self, pt: Point) -> bool:
+        ''' Add a point to the set.
+
+        Returns True if pt is on the hull of the points
+        added so far, and False if it is inside it, on
+        one of its edges, or already on it.
+        '''
+        in_lower: bool = self._insert(self._lower, pt, 1)
+        in_upper: bool = self._insert(self._upper, pt, -1)
+        return in_lower or in_upper
+
+    def add_many(self, pts: list[Point]) -> None:
+        ''' Add a batch of points to the set. '''
+        for pt in pts:
+            self.add(pt)
+
+    def hull(self) -> list[Point]:
+        ''' Return the current hull, in the same form as
+        graham(): counterclockwise, starting at the point
+        returned by min_point(), with no collinear points.
+        '''
+        if len(self._lower) == 0:
+            return []
+        hull: list[Point] = self._lower + self._upper[-2:0:-1]
+        min_idx: int = min_point(hull)
+        return hull[min_idx:] + hull[:min_idx]
+
+
+def main() -> None:
+    hull = IncrementalHull()
+    hull.add_many([Point(-1, 0), Point(0, 1)])
+    print(hull.hull())
+    hull.add_many([Point(0, -1), Point(1, 0), Point(0, 0)])
+    print(hull.hull())
+
+
+if __name__ == "__main__":
+    main()
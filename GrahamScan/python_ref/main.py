@@ -1,59 +1,243 @@
 
-from io import TextIOWrapper
+from array import array
+from io import BufferedReader
+import mmap
+import struct
 import sys
 import time
 from typing import Any
+from typing import Iterator
 
+from chan import chan
+from graham import cull_interior
 from graham import graham
+from graham import monotone_chain
+from incremental_hull import IncrementalHull
 from point import Point
-from point import parse_point
+from quickhull import quickhull
+from point import parse_points
+
+
+# Binary point files start with this magic number and the
+# number of points, followed by the points themselves as
+# little-endian int32 x/y pairs.  See tests/convert_points.py.
+BINARY_MAGIC: bytes = b"PTSBIN01"
+BINARY_HEADER: struct.Struct = struct.Struct("<8sQ")
+
+
+def is_binary_file(filename: str) -> bool:
+    pts_file: BufferedReader = open(filename, "rb")
+    magic: bytes = pts_file.read(len(BINARY_MAGIC))
+    pts_file.close()
+    return magic == BINARY_MAGIC
+
+
+def map_binary_coords(filename: str) -> memoryview:
+    ''' Memory-map a binary point file.
+
+    Returns a flat view of the coordinates (x0, y0, x1, y1, ...)
+    that refers directly to the mapped file, so nothing is
+    copied on a little-endian machine.
+    '''
+    pts_file: BufferedReader = open(filename, "rb")
+    data: mmap.mmap = mmap.mmap(pts_file.fileno(), 0, access=mmap.ACCESS_READ)
+    pts_file.close()
+
+    magic, num_pts = BINARY_HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC:
+        raise ValueError(f"map_binary_coords: {filename} is not a binary point file")
+    if len(data) != BINARY_HEADER.size + 8 * num_pts:
+        raise ValueError(f"map_binary_coords: {filename} does not hold {num_pts} points")
+
+    coords: memoryview = memoryview(data)[BINARY_HEADER.size:].cast("i")
+    if sys.byteorder != "little":
+        swapped: array = array("i", coords)
+        swapped.byteswap()
+        coords = memoryview(swapped)
+    return coords
 
 
 def read_points(filename: str) -> list[Point]:
-    pts_file: TextIOWrapper = open(filename, "r")
-    pts: list[Point] = []
-    for line in pts_file:
-        line = line.strip()
-        if len(line) == 0: continue
-        if line[0] == "#": continue
-        pt = parse_point(line)
-        pts.append(pt)
-    return pts
+    if is_binary_file(filename):
+        coords = iter(map_binary_coords(filename))
+        return [Point(x, y) for x, y in zip(coords, coords)]
+
+    pts_file: BufferedReader = open(filename, "rb")
+    data: bytes = pts_file.read()
+    pts_file.close()
+    return parse_points(data)
+
+
+# The size of the blocks read by read_point_chunks().
+STREAM_CHUNK_BYTES: int = 1 << 20
+
+
+def read_point_chunks(filename: str, chunk_bytes: int = STREAM_CHUNK_BYTES) -> Iterator[list[Point]]:
+    ''' Read a point file a block at a time, yielding
+    the points in each block as a list.
+
+    Only one block is in memory at once.  A text block
+    is cut after its last complete line, and the rest
+    is carried over to the next block.
+    '''
+    pts_file: BufferedReader = open(filename, "rb")
+    if pts_file.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+        pts_file.seek(0)
+        magic, num_pts = BINARY_HEADER.unpack(pts_file.read(BINARY_HEADER.size))
+        pts_per_chunk: int = max(chunk_bytes // 8, 1)
+        while num_pts > 0:
+            count: int = min(num_pts, pts_per_chunk)
+            coords: array = array("i")
+            try:
+                coords.fromfile(pts_file, 2 * count)
+            except EOFError:
+                raise ValueError(f"read_point_chunks: {filename} does not hold all of its points")
+            if sys.byteorder != "little":
+                coords.byteswap()
+            it = iter(coords)
+            yield [Point(x, y) for x, y in zip(it, it)]
+            num_pts -= count
+        pts_file.close()
+        return
+
+    pts_file.seek(0)
+    rest: bytes = b""
+    while True:
+        block: bytes = pts_file.read(chunk_bytes)
+        if len(block) == 0:
+            break
+        end: int = block.rfind(b"\n") + 1
+        if end == 0:
+            rest += block
+            continue
+        pts: list[Point] = parse_points(rest + block[:end])
+        rest = block[end:]
+        if len(pts) > 0:
+            yield pts
+    pts_file.close()
+    if len(rest) > 0:
+        pts = parse_points(rest)
+        if len(pts) > 0:
+            yield pts
 
 
 def write_points(pts: list[Point], filename: str = "") -> None:
     ''' Write a list of points to a file.
     
     If filename is a blank string, stdout is used.
+    The text is built first and written with a single call.
     '''
     if filename != "":
         pts_file: Any = open(filename, "w")
     else:
         pts_file = sys.stdout
 
-    for pt in pts:
-        pts_file.write(f"{str(pt)}\n")
+    pts_file.write("".join([f"({pt.x},{pt.y})\n" for pt in pts]))
 
     if filename != "":
         pts_file.close()
 
 
+ENGINES: tuple[str, ...] = ("graham", "monotone", "incremental", "chan", "quickhull")
+
+
+def compute_hull(pts: list[Point], engine: str = "graham", sort_mode: str = "angle") -> list[Point]:
+    ''' Compute the convex hull of pts with the named engine.
+
+    sort_mode is only used by graham() and chan().
+    '''
+    if engine not in ENGINES:
+        raise ValueError(f"compute_hull: unknown engine '{engine}'")
+    if engine == "monotone":
+        return monotone_chain(pts)
+    if engine == "incremental":
+        return IncrementalHull(pts).hull()
+    if engine == "chan":
+        return chan(pts, sort_mode)
+    if engine == "quickhull":
+        return quickhull(pts)
+    return graham(pts, sort_mode)
+
+
+def stream_hull(filename: str, engine: str = "graham", sort_mode: str = "angle",
+                cull: bool = False) -> tuple[list[Point], int, int]:
+    ''' Compute the convex hull of a point file without
+    loading all of it.
+
+    The hull of each block from read_point_chunks() is
+    merged into the hull of the blocks before it, by
+    computing the hull of the two together, so the memory
+    used is proportional to the block size plus the hull
+    size.  With cull, each block is culled first.
+
+    Returns the hull, the number of points read and the
+    number of points left after culling.
+    '''
+    hull: list[Point] = []
+    num_pts: int = 0
+    num_kept: int = 0
+    for pts in read_point_chunks(filename):
+        num_pts += len(pts)
+        if cull:
+            pts = cull_interior(pts)
+        num_kept += len(pts)
+        hull = compute_hull(hull + compute_hull(pts, engine, sort_mode), engine, sort_mode)
+    return hull, num_pts, num_kept
+
+
 def main() -> None:
-    if len(sys.argv) == 1:
-        print("usage: main <infile> [<outfile>]")
+    # Options start with "--"; everything else is positional.
+    args: list[str] = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    opts: list[str] = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+
+    if len(args) == 0:
+        print("usage: main [--engine=graham|monotone|incremental|chan|quickhull] [--sort=angle|slope] [--cull] [--stream] <infile> [<outfile>]")
         sys.exit()
 
-    infile:str = sys.argv[1]
+    engine: str = "graham"
+    sort_mode: str = "angle"
+    cull: bool = False
+    stream: bool = False
+    for opt in opts:
+        if opt.startswith("--engine="):
+            engine = opt[len("--engine="):]
+        elif opt.startswith("--sort="):
+            sort_mode = opt[len("--sort="):]
+        elif opt == "--cull":
+            cull = True
+        elif opt == "--stream":
+            stream = True
+        else:
+            print(f"main: unknown option '{opt}'")
+            sys.exit(1)
+    if engine not in ENGINES:
+        print(f"main: unknown engine '{engine}'")
+        sys.exit(1)
+
+    infile:str = args[0]
     outfile: str = ""
-    if len(sys.argv) > 2:
-        outfile = sys.argv[2]
+    if len(args) > 1:
+        outfile = args[1]
 
-    pts: list[Point] = read_points(infile)
-    start: float = time.thread_time()
-    hull = graham(pts)
-    end: float = time.thread_time()
+    if stream:
+        # Reading and computing the hull are interleaved,
+        # so here the time includes reading the file.
+        start: float = time.thread_time()
+        hull, num_pts, num_kept = stream_hull(infile, engine, sort_mode, cull)
+        end: float = time.thread_time()
+    else:
+        pts: list[Point] = read_points(infile)
+        start = time.thread_time()
+        num_pts = len(pts)
+        if cull:
+            pts = cull_interior(pts)
+        num_kept = len(pts)
+        hull = compute_hull(pts, engine, sort_mode)
+        end = time.thread_time()
     write_points(hull, outfile)
     print(f"{end-start:.4f}")
+    if cull:
+        print(f"culled {num_pts - num_kept} of {num_pts} points", file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ and .y instead of [0] and [1].
 '''
 
 import math
+import re
 from typing import Self
 
 
@@ -31,6 +32,28 @@ class Point:
         ''' Compute the distance from self to pt.'''
         return abs((pt.x - self.x)) + abs((pt.y - self.y))
 
+    def slope_to(self, pt: Self) -> int:
+        ''' Compute an exact integer sort key for pt around self.
+
+        This assumes self is the lowest point (smallest y, ties
+        broken by smallest x), so pt-self has an angle in [0, pi).
+        Over that range the angle increases with -dx/dy, so we
+        scale that slope by 2**32 and floor it.  Since dx and dy
+        are limited to 46340 (see README.md), the product of
+        two dy values is less than 2**32, so two different
+        slopes never floor to the same value, and two equal
+        slopes always do.
+
+        The manhattan distance fits in the low 17 bits, so
+        points with the same slope are ordered by distance.
+        '''
+        dx = pt.x - self.x
+        dy = pt.y - self.y
+        dist = abs(dx) + abs(dy)
+        if dy == 0:
+            return dist - (1 << 66)
+        return (((-dx << 32) // dy) << 17) + dist
+
 
 def parse_point(s):
     ''' Convert a string to a Point
@@ -46,3 +69,35 @@ def parse_point(s):
     if len(fields) != 2:
         raise ValueError(f"parse_point: {len(fields)} fields found, 2 expected")
     return Point(int(fields[0]), int(fields[1]))
+
+
+# A line that is not blank, not a comment, and not exactly
+# in the format produced by __str__.
+_IRREGULAR_LINE = re.compile(rb"^(?!\(-?\d+,-?\d+\)\r?$|[ \t\r]*$|#)", re.M)
+_COMMENT_LINE = re.compile(rb"^#.*$", re.M)
+_SEPARATORS = bytes.maketrans(b"(),", b"   ")
+
+
+def parse_points(data: bytes) -> list[Point]:
+    ''' Convert the contents of a point file to a list of Points
+
+    Blank lines and lines starting with '#' are skipped.
+    If every other line is exactly in the format produced
+    by __str__, all of the coordinates are pulled out of
+    the data in a single pass.  Otherwise each line is
+    given to parse_point(), so a malformed line raises
+    the same error it always has.
+    '''
+    if _IRREGULAR_LINE.search(data) is None:
+        if b"#" in data:
+            data = _COMMENT_LINE.sub(b"", data)
+        coords = iter(map(int, data.translate(_SEPARATORS).split()))
+        return [Point(x, y) for x, y in zip(coords, coords)]
+
+    pts: list[Point] = []
+    for line in data.decode().splitlines():
+        line = line.strip()
+        if len(line) == 0: continue
+        if line[0] == "#": continue
+        pts.append(parse_point(line))
+    return pts
@@ -0,0 +1,100 @@
+''' QuickHull, without recursion.
+
+The points are split by the line through the leftmost
+and rightmost points, and each side is handled as a task:
+an edge p->q of the hull found so far, and the points
+strictly outside it.  The point c farthest outside the
+edge is on the hull, so the task is replaced by the edges
+p->c and c->q, each with the points outside it; points
+inside the triangle p, c, q are dropped.  The tasks are
+kept on an explicit stack, so a bad input can make the
+stack long but cannot reach Python's recursion limit.
+
+The cross products for all of the points of a task are
+computed together, in list comprehensions, rather than
+by calling ccw() once per point.  They give the same
+values as ccw(), and points exactly on an edge are
+dropped, just as graham() drops collinear points.
+'''
+
+from itertools import compress
+from operator import attrgetter
+
+from graham import min_point
+from point import Point
+
+
+def quickhull(orig_pts: list[Point]) -> list[Point]:
+    ''' Python implementation of the QuickHull algorithm
+    for finding the convex hull of a set of points.
+
+    The hull is returned in the same form as graham():
+    counterclockwise, starting at the point returned
+    by min_point(), with no collinear points.
+    '''
+    key = attrgetter("x", "y")
+    a: Point = min(orig_pts, key = key)
+    b: Point = max(orig_pts, key = key)
+    if a is b:
+        return [a]
+
+    # ccw(a, b, pt) for every point; the points below the
+    # line are outside the edge a->b, and the points above
+    # it are outside the edge b->a.
+    dx: int = b.x - a.x
+    dy: int = b.y - a.y
+    turns: list[int] = [dx * (pt.y - a.y) - dy * (pt.x - a.x) for pt in orig_pts]
+    below: list[Point] = list(compress(orig_pts, [turn < 0 for turn in turns]))
+    above: list[Point] = list(compress(orig_pts, [turn > 0 for turn in turns]))
+
+    # Taking the tasks in stack order visits the edges in
+    # counterclockwise order, starting at a.
+    hull: list[Point] = []
+    tasks: list[tuple[Point, Point, list[Point]]] = [(b, a, above), (a, b, below)]
+    while len(tasks) > 0:
+        p, q, pts = tasks.pop()
+        if len(pts) == 0:
+            hull.append(p)
+            continue
+
+        # -ccw(p, q, pt), the distance outside p->q times |q-p|.
+        px: int = p.x
+        py: int = p.y
+        dx = q.x - px
+        dy = q.y - py
+        outs: list[int] = [dy * (pt.x - px) - dx * (pt.y - py) for pt in pts]
+        far: int = max(outs)
+        idx: int = outs.index(far)
+        if outs.count(far) > 1:
+            # The farthest points are on a line parallel to p->q.
+            # Take the one nearest p; the rest are then outside c->q.
+            idx = min((i for i, out in enumerate(outs) if out == far),
+                      key = lambda i: dx * (pts[i].x - px) + dy * (pts[i].y - py))
+        c: Point = pts[idx]
+
+        cx: int = c.x
+        cy: int = c.y
+        dx = cx - px
+        dy = cy - py
+        outside_pc: list[Point] = list(compress(
+            pts, [dy * (pt.x - px) - dx * (pt.y - py) > 0 for pt in pts]))
+        dx = q.x - cx
+        dy = q.y - cy
+        outside_cq: list[Point] = list(compress(
+            pts, [dy * (pt.x - cx) - dx * (pt.y - cy) > 0 for pt in pts]))
+        tasks.append((c, q, outside_cq))
+        tasks.append((p, c, outside_pc))
+
+    # Rotate the hull so it starts at the same point as graham().
+    min_idx: int = min_point(hull)
+    return hull[min_idx:] + hull[:min_idx]
+
+
+def main() -> None:
+    pts: list[Point] = [Point(-1, 0), Point(0, 1), Point(0, -1), Point(1, 0), Point(0, 0)]
+    hull = quickhull(pts)
+    print(hull)
+
+
+if __name__ == "__main__":
+    main()
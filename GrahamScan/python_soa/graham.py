@@ -0,0 +1,142 @@
+
+from array import array
+from itertools import compress
+from operator import add
+from operator import sub
+import math
+
+from point import Points
+
+
+def min_point(xs: array, ys: array) -> int:
+    ''' Return the index of the point with the
+    smallest y coordinate, with ties broken by
+    smallest x coordinate.
+
+    This assumes there is at least one point.
+    '''
+    return min(zip(ys, xs, range(len(xs))))[2]
+
+
+def ccw(xs: array, ys: array, i1: int, i2: int, i3: int) -> int:
+    ''' Determine the direction of the turn along
+     the path from point i1 to point i2 to point i3.
+     '''
+    dx21 = xs[i2] - xs[i1]
+    dy31 = ys[i3] - ys[i1]
+    dy21 = ys[i2] - ys[i1]
+    dx31 = xs[i3] - xs[i1]
+    return dx21 * dy31 - dy21 * dx31
+
+
+def cull_interior(pts: Points) -> Points:
+    ''' Akl-Toussaint heuristic: remove the points that
+    cannot be on the convex hull.
+
+    This is the same test as cull_interior() in python_ref:
+    points strictly inside the octagon formed by the extreme
+    points in x, y, x+y and x-y are dropped, and the rest
+    keep their original order.
+    '''
+    xs, ys = pts.xs, pts.ys
+    if len(xs) < 3:
+        return pts.take(list(range(len(xs))))
+
+    sums: list[int] = list(map(add, xs, ys))
+    diffs: list[int] = list(map(sub, xs, ys))
+
+    # The extreme points, in counterclockwise order
+    # starting with the lowest one.
+    extremes: list[int] = [
+        ys.index(min(ys)),
+        diffs.index(max(diffs)),
+        xs.index(max(xs)),
+        sums.index(max(sums)),
+        ys.index(max(ys)),
+        diffs.index(min(diffs)),
+        xs.index(min(xs)),
+        sums.index(min(sums)),
+    ]
+
+    # Several directions can share an extreme point;
+    # a repeated vertex would give an edge of length 0.
+    octagon: list[tuple[int, int]] = []
+    for i in extremes:
+        if len(octagon) == 0 or (xs[i], ys[i]) != octagon[-1]:
+            octagon.append((xs[i], ys[i]))
+    while len(octagon) > 1 and octagon[-1] == octagon[0]:
+        octagon.pop()
+    if len(octagon) < 3:
+        return pts.take(list(range(len(xs))))
+
+    # For each edge a->b, a counterclockwise turn to the point
+    # can be written as ea * x + eb * y > ec.  Repeating edges
+    # is harmless, so we always have exactly eight of them.
+    edges: list[tuple[int, int, int]] = []
+    for i in range(8):
+        ax, ay = octagon[i % len(octagon)]
+        bx, by = octagon[(i + 1) % len(octagon)]
+        edges.append((ay - by, bx - ax, (ay - by) * ax + (bx - ax) * ay))
+    (a0, b0, c0), (a1, b1, c1), (a2, b2, c2), (a3, b3, c3), \
+        (a4, b4, c4), (a5, b5, c5), (a6, b6, c6), (a7, b7, c7) = edges
+
+    keep: list[bool] = [
+        a0 * x + b0 * y <= c0 or a1 * x + b1 * y <= c1 or
+        a2 * x + b2 * y <= c2 or a3 * x + b3 * y <= c3 or
+        a4 * x + b4 * y <= c4 or a5 * x + b5 * y <= c5 or
+        a6 * x + b6 * y <= c6 or a7 * x + b7 * y <= c7
+        for x, y in zip(xs, ys)]
+    return Points(array("i", compress(xs, keep)), array("i", compress(ys, keep)))
+
+
+def graham(pts: Points, sort_mode: str = "angle") -> Points:
+    ''' Python implementation of the Graham Scan algorithm
+    for finding the convex hull of a set of points
+    in a plan.
+
+    The points are stored as two coordinate arrays, and
+    the algorithm works on indices into them: the indices
+    are sorted, and the hull is kept as a stack of indices,
+    so no per-point objects are created.
+
+    sort_mode is "angle" or "slope", as in python_ref.
+    '''
+    if sort_mode not in ("angle", "slope"):
+        raise ValueError(f"graham: unknown sort mode '{sort_mode}'")
+
+    xs, ys = pts.xs, pts.ys
+    min_idx: int = min_point(xs, ys)
+    x0: int = xs[min_idx]
+    y0: int = ys[min_idx]
+    idxs: list[int] = list(range(min_idx)) + list(range(min_idx + 1, len(xs)))
+
+    # The keys are computed for every point up front, so the
+    # sort itself only has to look them up by index.
+    dxs: list[int] = [x - x0 for x in xs]
+    dys: list[int] = [y - y0 for y in ys]
+    dists: list[int] = [abs(dx) + abs(dy) for dx, dy in zip(dxs, dys)]
+    keys: list
+    if sort_mode == "slope":
+        # See Point.slope_to() in python_ref for why this is exact.
+        keys = [dist - (1 << 66) if dy == 0 else (((-dx << 32) // dy) << 17) + dist
+                for dx, dy, dist in zip(dxs, dys, dists)]
+    else:
+        keys = list(zip(map(math.atan2, dys, dxs), dists))
+    idxs.sort(key = keys.__getitem__)
+
+    hull: list[int] = [min_idx]
+    for i in idxs:
+        while len(hull) > 1 and ccw(xs, ys, hull[-2], hull[-1], i) <= 0:
+            hull.pop()
+        hull.append(i)
+    return pts.take(hull)
+
+
+def main() -> None:
+    pts: Points = Points(array("i", [-1, 0, 0, 1]), array("i", [0, 1, -1, 0]))
+    hull = graham(pts)
+    print(hull)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+''' Definition of a set of Points.
+
+In this version there is no per-point object.  A set
+of points is stored as two arrays of 32 bit ints, one
+for the x coordinates and one for the y coordinates
+(a "structure of arrays"), and a single point is just
+an index into those arrays.
+'''
+
+from array import array
+import re
+
+
+class Points:
+    ''' A set of points, stored as two coordinate arrays. '''
+    __slots__ = ("xs", "ys")
+
+    def __init__(self, xs: array, ys: array) -> None:
+        self.xs = xs
+        self.ys = ys
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __repr__(self):
+        return f"Points({list(zip(self.xs, self.ys))})"
+
+    def take(self, idxs: list[int]) -> "Points":
+        ''' Return a new Points holding the points at the given indices. '''
+        xs, ys = self.xs, self.ys
+        return Points(array("i", [xs[i] for i in idxs]), array("i", [ys[i] for i in idxs]))
+
+
+def from_coords(coords: array) -> Points:
+    ''' Split a flat array of coordinates (x0, y0, x1, y1, ...) into Points. '''
+    return Points(coords[0::2], coords[1::2])
+
+
+def parse_point(s: str) -> tuple[int, int]:
+    ''' Convert a string to an (x, y) pair
+
+    The string must be in the format (<x>,<y>).
+    '''
+    if s[0] != "(":
+        raise ValueError("parse_point: does not start with '('")
+    if s[-1] != ")":
+        raise ValueError("parse_point: does not end with ')'")
+    fields = s[1:-1].replace(" ", "").split(",")
+    if len(fields) != 2:
+        raise ValueError(f"parse_point: {len(fields)} fields found, 2 expected")
+    return int(fields[0]), int(fields[1])
+
+
+# A line that is not blank, not a comment, and not exactly
+# in the format (<x>,<y>).
+_IRREGULAR_LINE = re.compile(rb"^(?!\(-?\d+,-?\d+\)\r?$|[ \t\r]*$|#)", re.M)
+_COMMENT_LINE = re.compile(rb"^#.*$", re.M)
+_SEPARATORS = bytes.maketrans(b"(),", b"   ")
+
+
+def parse_points(data: bytes) -> Points:
+    ''' Convert the contents of a point file to Points
+
+    Blank lines and lines starting with '#' are skipped.
+    If every other line is exactly in the format (<x>,<y>),
+    all of the coordinates are pulled out of the data in a
+    single pass.  Otherwise each line is given to parse_point(),
+    so a malformed line raises the same error it always has.
+    '''
+    if _IRREGULAR_LINE.search(data) is None:
+        if b"#" in data:
+            data = _COMMENT_LINE.sub(b"", data)
+        return from_coords(array("i", map(int, data.translate(_SEPARATORS).split())))
+
+    coords: array = array("i")
+    for line in data.decode().splitlines():
+        line = line.strip()
+        if len(line) == 0: continue
+        if line[0] == "#": continue
+        coords.extend(parse_point(line))
+    return from_coords(coords)
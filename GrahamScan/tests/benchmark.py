@@ -0,0 +1,225 @@
+'''
+    benchmark.py
+
+    Timing harness for the Python implementations.
+
+    main.py in each implementation times only the hull
+    computation, once.  This program imports the read_points(),
+    compute_hull() and write_points() functions from an
+    implementation directory and times each of the three
+    phases separately, over several repetitions, in both
+    wall clock time (time.perf_counter) and CPU time
+    (time.process_time).
+
+    With --memory, one more untimed run is made under
+    tracemalloc to report how much memory the points take
+    and the peak memory used while reading and computing
+    the hull.
+
+    The results can also be appended to a JSON Lines file,
+    one record per run, so that results for the different
+    implementations can be tracked over time.
+'''
+import datetime
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+PHASES = ("read", "hull", "write")
+
+
+def load_implementation(impl_dir: str):
+    ''' Import main.py (and graham.py) from the given directory.
+
+    The implementations all use the same module names,
+    so only one can be loaded per process.
+    '''
+    sys.path.insert(0, os.path.abspath(impl_dir))
+    main_module = importlib.import_module("main")
+    graham_module = importlib.import_module("graham")
+    return main_module, graham_module
+
+
+def summarize(samples: list[float]) -> dict:
+    ''' Reduce a list of timings to min, median and standard deviation '''
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "samples": samples,
+    }
+
+
+def time_phase(func, *args):
+    ''' Call func(*args), returning its result and
+    the wall clock and CPU time it took.
+    '''
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    result = func(*args)
+    cpu_end = time.process_time()
+    wall_end = time.perf_counter()
+    return result, wall_end - wall_start, cpu_end - cpu_start
+
+
+def measure_memory(read_points, hull_phase, infile: str) -> dict:
+    ''' Measure memory use with tracemalloc.
+
+    Returns the memory still allocated after reading the
+    points (that is, the memory the points themselves take),
+    the peak while reading them, and the peak while computing
+    the hull, all in bytes.
+    '''
+    tracemalloc.start()
+    pts = read_points(infile)
+    points_bytes, read_peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    hull_phase(pts)
+    hull_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "points_bytes": points_bytes,
+        "bytes_per_point": points_bytes / max(len(pts), 1),
+        "read_peak_bytes": read_peak,
+        "hull_peak_bytes": hull_peak,
+    }
+
+
+def run_benchmark(impl_dir: str, infile: str, repeat: int, warmup: int,
+                  engine: str, sort_mode: str, cull: bool, memory: bool) -> dict:
+    ''' Time the read, hull and write phases for one
+    implementation and one input file.
+
+    The hull phase includes the culling pass if cull is True.
+    The hull is written to os.devnull, so the write phase
+    measures formatting and the file calls, not the disk.
+    '''
+    main_module, graham_module = load_implementation(impl_dir)
+
+    def hull_phase(pts):
+        if cull:
+            pts = graham_module.cull_interior(pts)
+        return main_module.compute_hull(pts, engine, sort_mode)
+
+    wall: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    cpu: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    num_pts = 0
+    hull_size = 0
+    for i in range(warmup + repeat):
+        pts, read_wall, read_cpu = time_phase(main_module.read_points, infile)
+        hull, hull_wall, hull_cpu = time_phase(hull_phase, pts)
+        _, write_wall, write_cpu = time_phase(main_module.write_points, hull, os.devnull)
+        num_pts = len(pts)
+        hull_size = len(hull)
+        if i < warmup:
+            continue
+        for phase, w, c in zip(PHASES,
+                               (read_wall, hull_wall, write_wall),
+                               (read_cpu, hull_cpu, write_cpu)):
+            wall[phase].append(w)
+            cpu[phase].append(c)
+
+    result = {
+        "implementation": os.path.basename(os.path.abspath(impl_dir)),
+        "input": os.path.basename(infile),
+        "num_points": num_pts,
+        "hull_size": hull_size,
+        "engine": engine,
+        "sort_mode": sort_mode,
+        "cull": cull,
+        "repeat": repeat,
+        "warmup": warmup,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "wall": {phase: summarize(wall[phase]) for phase in PHASES},
+        "cpu": {phase: summarize(cpu[phase]) for phase in PHASES},
+    }
+    if memory:
+        result["memory"] = measure_memory(main_module.read_points, hull_phase, infile)
+    return result
+
+
+def print_results(result: dict) -> None:
+    ''' Print a benchmark result as a table '''
+    print(f"{result['implementation']} {result['input']}: "
+          f"{result['num_points']} points, {result['hull_size']} on hull, "
+          f"{result['repeat']} runs")
+    print(f"    {'phase':6} {'clock':5} {'min':>9} {'median':>9} {'stdev':>9}")
+    for phase in PHASES:
+        for clock in ("wall", "cpu"):
+            stats = result[clock][phase]
+            print(f"    {phase:6} {clock:5} {stats['min']:9.4f} "
+                  f"{stats['median']:9.4f} {stats['stdev']:9.4f}")
+    if "memory" in result:
+        memory = result["memory"]
+        print(f"    points    {memory['points_bytes'] / 1e6:9.1f} MB "
+              f"({memory['bytes_per_point']:.1f} bytes per point)")
+        print(f"    read peak {memory['read_peak_bytes'] / 1e6:9.1f} MB")
+        print(f"    hull peak {memory['hull_peak_bytes'] / 1e6:9.1f} MB")
+
+
+def main(argv):
+    ''' main function '''
+    args = [arg for arg in argv[1:] if not arg.startswith("--")]
+    opts = [arg for arg in argv[1:] if arg.startswith("--")]
+
+    if len(args) < 2:
+        print("usage: benchmark [options] <impldir> <infile>")
+        print("    Times reading <infile>, computing its hull, and writing")
+        print("    the hull, using the main.py in <impldir>.")
+        print("    options:")
+        print("        --repeat=<n>      number of timed runs (default 5)")
+        print("        --warmup=<n>      number of untimed runs first (default 1)")
+        print("        --json=<file>     append the results to <file> as JSON Lines")
+        print("        --engine=<name>   hull engine to use (default graham)")
+        print("        --sort=<mode>     sort mode for graham (default angle)")
+        print("        --cull            cull interior points first")
+        print("        --memory          also measure memory use with tracemalloc")
+        sys.exit()
+
+    repeat = 5
+    warmup = 1
+    json_file = ""
+    engine = "graham"
+    sort_mode = "angle"
+    cull = False
+    memory = False
+    for opt in opts:
+        if opt.startswith("--repeat="):
+            repeat = int(opt[len("--repeat="):])
+        elif opt.startswith("--warmup="):
+            warmup = int(opt[len("--warmup="):])
+        elif opt.startswith("--json="):
+            json_file = opt[len("--json="):]
+        elif opt.startswith("--engine="):
+            engine = opt[len("--engine="):]
+        elif opt.startswith("--sort="):
+            sort_mode = opt[len("--sort="):]
+        elif opt == "--cull":
+            cull = True
+        elif opt == "--memory":
+            memory = True
+        else:
+            print(f"benchmark: unknown option '{opt}'")
+            sys.exit(1)
+    if repeat < 1:
+        print("benchmark: --repeat must be at least 1")
+        sys.exit(1)
+
+    result = run_benchmark(args[0], args[1], repeat, warmup, engine, sort_mode, cull, memory)
+    print_results(result)
+
+    if json_file != "":
+        with open(json_file, "a", encoding="utf_8") as out_file:
+            out_file.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,68 @@
+'''
+    chan_bench.py
+
+    Compares chan() with graham() in python_ref.
+
+    Chan's algorithm is output-sensitive: it should win when
+    the hull is small compared with the number of points,
+    and lose when most of the points are on the hull.  This
+    program times both on each input file given, and prints
+    them by h/N, the fraction of the points on the hull.
+    Use generate_points.py to make inputs with a small h/N
+    (the default) and a large one (--circle).  Each time is
+    the best of three runs, and every hull from chan() is
+    checked against the one from graham().
+'''
+import os
+import sys
+import time
+
+
+REPEAT = 3
+
+
+def time_it(func):
+    ''' Call func() REPEAT times, and return its result
+    and the smallest CPU time it took.
+    '''
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.process_time()
+        result = func()
+        best = min(best, time.process_time() - start)
+    return result, best
+
+
+def main(argv):
+    ''' main function '''
+    if len(argv) < 2:
+        print("usage: chan_bench <infile> ...")
+        print("    Times graham() and chan() from python_ref on each")
+        print("    <infile>, and prints the times by the fraction of")
+        print("    the points that are on the hull.")
+        sys.exit()
+
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.join(os.path.dirname(tests_dir), "python_ref"))
+    import chan
+    import graham
+    import main as impl_main
+
+    rows = []
+    for infile in argv[1:]:
+        pts = impl_main.read_points(infile)
+        hull, graham_time = time_it(lambda: graham.graham(pts))
+        chan_hull, chan_time = time_it(lambda: chan.chan(pts))
+        same = [(pt.x, pt.y) for pt in hull] == [(pt.x, pt.y) for pt in chan_hull]
+        rows.append((len(hull) / len(pts), len(pts), len(hull), graham_time, chan_time,
+                     same, os.path.basename(infile)))
+
+    print(f"{'h/N':>9} {'N':>9} {'h':>7} {'graham':>8} {'chan':>8} {'speedup':>8}  input")
+    for ratio, num_pts, hull_size, graham_time, chan_time, same, name in sorted(rows):
+        status = "" if same else "  WRONG HULL"
+        print(f"{ratio:9.6f} {num_pts:9} {hull_size:7} {graham_time:8.4f} {chan_time:8.4f} "
+              f"{graham_time / chan_time:8.2f}  {name}{status}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,71 @@
+'''
+    parallel_bench.py
+
+    Speedup curve for parallel_hull() in python_ref.
+
+    Reads a point file once, then times graham() and
+    parallel_hull() with 1, 2, 4, ... workers, up to the
+    given maximum (the number of CPUs by default), and
+    prints the speedup of each over graham().  The times
+    are wall clock times (time.perf_counter), since most
+    of the work happens in other processes, and they
+    include starting the worker processes.  Each time is
+    the best of three runs.  Every hull is checked against
+    the one from graham().
+'''
+import os
+import sys
+import time
+
+
+REPEAT = 3
+
+
+def time_it(func):
+    ''' Call func() REPEAT times, and return its result
+    and the smallest wall clock time it took.
+    '''
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main(argv):
+    ''' main function '''
+    if len(argv) < 2:
+        print("usage: parallel_bench <infile> [<maxworkers>]")
+        print("    Times graham() and parallel_hull() from python_ref on")
+        print("    <infile>, with 1, 2, 4, ... up to <maxworkers> workers")
+        print("    (default: the number of CPUs).")
+        sys.exit()
+
+    max_workers = os.cpu_count() or 1
+    if len(argv) > 2:
+        max_workers = int(argv[2])
+
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.join(os.path.dirname(tests_dir), "python_ref"))
+    import graham
+    import main as impl_main
+
+    pts = impl_main.read_points(argv[1])
+    hull, base_time = time_it(lambda: graham.graham(pts))
+    expected = [(pt.x, pt.y) for pt in hull]
+
+    print(f"{len(pts)} points, {len(hull)} on hull, {os.cpu_count()} CPUs")
+    print(f"    {'':16} {'time':>8} {'speedup':>8}")
+    print(f"    {'graham':16} {base_time:8.4f} {1.0:8.2f}")
+    workers = 1
+    while workers <= max_workers:
+        hull, par_time = time_it(lambda: graham.parallel_hull(pts, workers))
+        status = "" if [(pt.x, pt.y) for pt in hull] == expected else "  WRONG HULL"
+        print(f"    {'parallel_hull ' + str(workers):16} {par_time:8.4f} "
+              f"{base_time / par_time:8.2f}{status}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(sys.argv)
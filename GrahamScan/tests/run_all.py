@@ -0,0 +1,252 @@
+'''
+    run_all.py
+
+    Program to run every implementation against every
+    timing input, check the results, and compare the times.
+
+    An implementation is any directory next to this one
+    that contains a main.py (run with this Python) or a
+    Main.java (compiled with javac and run with java).
+    The inputs are the test_<numpoints>_<size>.input.txt
+    (or .input.bin) files in this directory, plus any files
+    given on the command line.  Each run happens in its own process,
+    and its output is compared with the matching
+    .expected.txt file, if there is one.
+
+    Each implementation prints the hull time as the last
+    line of its standard output; those times are collected
+    into a table, and into a chart of time against the
+    number of points.  The chart is drawn with matplotlib
+    if it is installed, and as text otherwise.
+'''
+import math
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(TESTS_DIR)
+INPUT_NAME = re.compile(r"test_(\d+)_(\d+)\.input\.(txt|bin)$")
+
+
+def find_implementations() -> list[tuple[str, str]]:
+    ''' Return (name, kind) for each implementation directory,
+    where kind is "python" or "java".
+    '''
+    impls = []
+    for name in sorted(os.listdir(ROOT_DIR)):
+        impl_dir = os.path.join(ROOT_DIR, name)
+        if impl_dir == TESTS_DIR or not os.path.isdir(impl_dir):
+            continue
+        if os.path.exists(os.path.join(impl_dir, "main.py")):
+            impls.append((name, "python"))
+        elif os.path.exists(os.path.join(impl_dir, "Main.java")):
+            impls.append((name, "java"))
+    return impls
+
+
+def find_inputs(extra: list[str]) -> list[tuple[int, str]]:
+    ''' Return (numpoints, path) for each timing input, sorted by size '''
+    paths = [os.path.join(TESTS_DIR, name) for name in os.listdir(TESTS_DIR)]
+    paths += [os.path.abspath(path) for path in extra]
+    inputs = []
+    for path in paths:
+        match = INPUT_NAME.search(os.path.basename(path))
+        if match is not None:
+            inputs.append((int(match.group(1)), path))
+    return sorted(set(inputs))
+
+
+def expected_file(input_path: str) -> str:
+    ''' Return the .expected.txt file for an input, or "" if there is none.
+
+    The expected file is looked for next to the input,
+    and then in this directory.
+    '''
+    name = INPUT_NAME.sub(r"test_\1_\2.expected.txt", os.path.basename(input_path))
+    for directory in (os.path.dirname(input_path), TESTS_DIR):
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            return path
+    return ""
+
+
+def build_command(name: str, kind: str, build_dir: str) -> list[str]:
+    ''' Return the command to run an implementation,
+    compiling it first if needed.  Returns an empty
+    list if it can't be built.
+    '''
+    impl_dir = os.path.join(ROOT_DIR, name)
+    if kind == "python":
+        return [sys.executable, os.path.join(impl_dir, "main.py")]
+
+    if shutil.which("javac") is None or shutil.which("java") is None:
+        return []
+    class_dir = os.path.join(build_dir, name)
+    os.makedirs(class_dir, exist_ok=True)
+    sources = [os.path.join(impl_dir, source)
+               for source in os.listdir(impl_dir) if source.endswith(".java")]
+    result = subprocess.run(["javac", "-d", class_dir] + sources,
+                            capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        print(f"run_all: could not compile {name}:\n{result.stderr}", file=sys.stderr)
+        return []
+    return ["java", "-cp", class_dir, "Main"]
+
+
+def read_lines(filename: str) -> list[str]:
+    with open(filename, "r", encoding="utf_8") as in_file:
+        return [line.strip() for line in in_file if line.strip() != ""]
+
+
+def run_one(command: list[str], input_path: str, output_path: str,
+            timeout: float) -> tuple[str, float]:
+    ''' Run one implementation on one input.
+
+    Returns a status ("ok", "FAIL", "ERROR", "TIMEOUT", or "no expected")
+    and the time printed by the implementation (NaN if there is none).
+    The error output of a failed run is passed on to stderr.
+    '''
+    try:
+        result = subprocess.run(command + [input_path, output_path],
+                                capture_output=True, text=True,
+                                timeout=timeout, check=False)
+    except subprocess.TimeoutExpired:
+        return "TIMEOUT", math.nan
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        return "ERROR", math.nan
+
+    try:
+        seconds = float(result.stdout.split()[-1])
+    except (IndexError, ValueError):
+        return "ERROR", math.nan
+
+    expected = expected_file(input_path)
+    if expected == "":
+        return "no expected", seconds
+    if read_lines(output_path) != read_lines(expected):
+        return "FAIL", seconds
+    return "ok", seconds
+
+
+def print_table(impls: list[str], inputs: list[tuple[int, str]],
+                results: dict[tuple[str, str], tuple[str, float]]) -> None:
+    width = max(len(name) for name in impls + ["numpoints"])
+    print(f"{'input':32} {'numpoints':>10}  " + "  ".join(f"{name:>{width}}" for name in impls))
+    for num_pts, path in inputs:
+        cells = []
+        for name in impls:
+            status, seconds = results[(name, path)]
+            cell = f"{seconds:.4f}" if not math.isnan(seconds) else ""
+            if status != "ok":
+                cell = f"{cell} {status}".strip()
+            cells.append(f"{cell:>{width}}")
+        print(f"{os.path.basename(path):32} {num_pts:>10}  " + "  ".join(cells))
+
+
+def print_chart(impls: list[str], inputs: list[tuple[int, str]],
+                results: dict[tuple[str, str], tuple[str, float]]) -> None:
+    ''' Print a text chart of time against the number of points.
+
+    The bars use a log scale, from 0.1 ms to the slowest time.
+    '''
+    times = [seconds for _, seconds in results.values() if not math.isnan(seconds)]
+    if len(times) == 0:
+        return
+    low = math.log10(1e-4)
+    high = max(math.log10(max(max(times), 1e-3)), low + 1)
+    width = max(len(name) for name in impls)
+    for num_pts, path in inputs:
+        print(f"N = {num_pts} ({os.path.basename(path)})")
+        for name in impls:
+            seconds = results[(name, path)][1]
+            if math.isnan(seconds):
+                continue
+            bar = round(50 * (math.log10(max(seconds, 1e-4)) - low) / (high - low))
+            print(f"    {name:{width}} {'#' * bar} {seconds:.4f}")
+
+
+def save_chart(impls: list[str], inputs: list[tuple[int, str]],
+               results: dict[tuple[str, str], tuple[str, float]], filename: str) -> bool:
+    ''' Save a log-log chart of time against the number of points.
+
+    Returns False if matplotlib is not available.
+    '''
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return False
+
+    fig, ax = plt.subplots()
+    for name in impls:
+        points = [(num_pts, results[(name, path)][1]) for num_pts, path in inputs
+                  if not math.isnan(results[(name, path)][1])]
+        if len(points) > 0:
+            ax.plot([p[0] for p in points], [p[1] for p in points], marker="o", label=name)
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel("number of points")
+    ax.set_ylabel("hull time (s)")
+    ax.legend()
+    fig.savefig(filename)
+    return True
+
+
+def main(argv):
+    ''' main function '''
+    args = [arg for arg in argv[1:] if not arg.startswith("--")]
+    opts = [arg for arg in argv[1:] if arg.startswith("--")]
+
+    chart_file = ""
+    timeout = 600.0
+    for opt in opts:
+        if opt.startswith("--chart="):
+            chart_file = opt[len("--chart="):]
+        elif opt.startswith("--timeout="):
+            timeout = float(opt[len("--timeout="):])
+        else:
+            print("usage: run_all [--chart=<file>] [--timeout=<seconds>] [<inputfile> ...]")
+            print("    Runs every implementation on every test_<numpoints>_<size>")
+            print("    input in the tests directory, plus any given <inputfile>s,")
+            print("    checks the results and prints a table of the times.")
+            print("    --chart saves a chart of time against the number of points")
+            print("    (requires matplotlib).")
+            sys.exit()
+
+    inputs = find_inputs(args)
+    results: dict[tuple[str, str], tuple[str, float]] = {}
+    impls: list[str] = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for name, kind in find_implementations():
+            command = build_command(name, kind, work_dir)
+            if len(command) == 0:
+                print(f"run_all: skipping {name}; it could not be built", file=sys.stderr)
+                continue
+            impls.append(name)
+            for num_pts, path in inputs:
+                output_path = os.path.join(work_dir, "output.txt")
+                results[(name, path)] = run_one(command, path, output_path, timeout)
+                print(f"{name} {os.path.basename(path)}: {results[(name, path)][0]}",
+                      file=sys.stderr)
+
+    if len(impls) == 0 or len(inputs) == 0:
+        print("run_all: nothing to run")
+        return
+
+    print_table(impls, inputs, results)
+    print()
+    print_chart(impls, inputs, results)
+    if chart_file != "":
+        if not save_chart(impls, inputs, results, chart_file):
+            print("run_all: matplotlib is not installed; no chart saved", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,84 @@
+'''
+    sort_key_bench.py
+
+    Micro-benchmark for the angular sort in graham().
+
+    The sort is most of the run time of graham(), and it
+    has two parts: computing a key for each point, and the
+    sort itself.  This program times them separately for
+    one implementation, for the original approach (a lambda
+    returning an (angle, distance) tuple for each point),
+    and for the precomputed keys used by graham() now
+    (sort_keys() followed by two stable sorts of indices).
+    Each time is the best of three runs.
+'''
+import os
+import sys
+import time
+
+
+REPEAT = 3
+
+
+def time_it(func):
+    ''' Call func() REPEAT times, and return its result
+    and the smallest CPU time it took.
+    '''
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.process_time()
+        result = func()
+        best = min(best, time.process_time() - start)
+    return result, best
+
+
+def main(argv):
+    ''' main function '''
+    if len(argv) < 3:
+        print("usage: sort_key_bench <impldir> <infile>")
+        print("    Times computing the sort keys and sorting separately,")
+        print("    using graham.py and main.py from <impldir>, which must")
+        print("    provide sort_keys() (python_ref, python_point_as_tuple,")
+        print("    python_point_slots or python_point_namedtuple).")
+        sys.exit()
+
+    sys.path.insert(0, os.path.abspath(argv[1]))
+    import graham
+    import main as impl_main
+
+    orig_pts = impl_main.read_points(argv[2])
+    min_idx = graham.min_point(orig_pts)
+    p0 = orig_pts[min_idx]
+    pts = orig_pts[:min_idx] + orig_pts[min_idx+1:]
+
+    # The original key: a lambda, two calls and a tuple per point.
+    if hasattr(graham, "angle"):
+        def key(pt):
+            return (graham.angle(p0, pt), graham.manhattan_distance(p0, pt))
+    else:
+        def key(pt):
+            return (p0.angle_to(pt), p0.manhattan_distance(pt))
+
+    lambda_keys, lambda_key_time = time_it(lambda: list(map(key, pts)))
+    _, lambda_sort_time = time_it(lambda: sorted(range(len(pts)), key = lambda_keys.__getitem__))
+    _, lambda_total_time = time_it(lambda: sorted(pts, key = key))
+
+    # The precomputed keys, sorted one at a time.
+    (angles, dists), key_time = time_it(lambda: graham.sort_keys(p0, pts))
+    def two_sorts():
+        order = sorted(range(len(pts)), key = dists.__getitem__)
+        order.sort(key = angles.__getitem__)
+        return order
+    order, sort_time = time_it(two_sorts)
+    _, gather_time = time_it(lambda: [pts[i] for i in order])
+
+    print(f"{len(pts)} points")
+    print(f"    {'':22} {'keys':>8} {'sort':>8} {'total':>8}")
+    print(f"    {'lambda tuple key':22} {lambda_key_time:8.4f} {lambda_sort_time:8.4f} "
+          f"{lambda_total_time:8.4f}")
+    print(f"    {'precomputed keys':22} {key_time:8.4f} {sort_time + gather_time:8.4f} "
+          f"{key_time + sort_time + gather_time:8.4f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)